@@ -1,3 +1,14 @@
+import asyncio
+import functools
+import hashlib
+import json
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import google.generativeai as genai
 import numpy as np
 from typing import List, Union, Dict
@@ -9,10 +20,29 @@ class LLMUtilitySuite:
     chat sessions, and text embeddings.
     """
     _instance = None
+    # Class-level configuration flag: checked on every LLMUtilitySuite() call
+    # (the DI pattern used across the codebase), so it should be a plain class
+    # attribute lookup rather than a hasattr probe of the instance dict.
+    _configured = False
+    _lock = threading.Lock()
+
+    # Semantic-cache tuning: how similar (cosine) a prompt must be to a cached
+    # one to reuse its response, and how long a cached response stays valid.
+    CACHE_SIMILARITY_THRESHOLD = 0.92
+    CACHE_TTL_SECONDS = 3600
+    CACHE_DB_PATH = os.path.expanduser("~/.cache/llm_suite.db")
+    # Response bodies live in an append-only sidecar file; SQLite keeps only
+    # (offset, length) so large responses are not duplicated between the
+    # SQLite page cache and Python strings.
+    CACHE_BIN_PATH = os.path.expanduser("~/.cache/llm_suite_responses.bin")
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
-            cls._instance = super(LLMUtilitySuite, cls).__new__(cls)
+            # Double-checked locking: the lock is only taken before the first
+            # instance exists, so multi-threaded GUIs cannot double-configure.
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(LLMUtilitySuite, cls).__new__(cls)
         return cls._instance
 
     def __init__(self, api_key: str = None):
@@ -24,48 +54,438 @@ class LLMUtilitySuite:
                                      Required on first instantiation.
         """
         # The __init__ is called every time LLMUtilitySuite() is invoked,
-        # but we use a flag to ensure the configuration runs only once.
-        if not hasattr(self, 'is_initialized'):
+        # but the class-level flag ensures the configuration runs only once.
+        if not LLMUtilitySuite._configured:
             if api_key is None:
                 raise ValueError("API key is required for the first initialization.")
-            
+
             try:
                 genai.configure(api_key=api_key)
                 print("LLM API Suite configured successfully.")
-                self.is_initialized = True
+                # Semantic cache: per-namespace buckets holding one (N, D)
+                # float32 matrix of pre-normalized prompt embeddings plus
+                # parallel response/timestamp lists, backed by SQLite so the
+                # cache survives across process runs.
+                self._cache_ns = {}
+                self._resp_file = self._open_response_store()
+                self._resp_mm = None
+                self._cache_db = self._open_cache_db()
+                LLMUtilitySuite._configured = True
             except Exception as e:
-                self.is_initialized = False
+                LLMUtilitySuite._configured = False
                 raise ConnectionError(f"Failed to configure API: {e}")
 
     # --- PROMPTING METHODS ---
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _get_model(model_name: str, system_prompt: str = None) -> genai.GenerativeModel:
+        """
+        Returns a cached model instance for a (model_name, system_prompt) pair.
+
+        Constructing a GenerativeModel redoes client setup on every call, so
+        instances are built once and reused across all subsequent requests.
+        """
+        return genai.GenerativeModel(model_name, system_instruction=system_prompt)
+
     def generate_text(
         self,
         prompt: str,
         model_name: str = "gemini-flash-latest",
-        system_prompt: str = None
+        system_prompt: str = None,
+        no_cache: bool = False
     ) -> str:
         """
         Generates text content based on a user prompt and an optional system prompt.
 
+        A local semantic cache is consulted first: the prompt is embedded and
+        compared (cosine similarity) against previously answered prompts, so
+        repeated or paraphrased prompts are served without a network call.
+
         Args:
             prompt (str): The text prompt to send to the model.
             model_name (str, optional): The name of the model to use.
             system_prompt (str, optional): A system instruction to guide the model.
+            no_cache (bool, optional): When True, bypass the semantic cache.
 
         Returns:
             str: The generated text response from the model.
         """
+        namespace = self._cache_namespace(system_prompt, model_name)
+        query_embedding = None
+        if not no_cache:
+            query_embedding = self._embed_prompt(prompt)
+            cached = self._cache_lookup(query_embedding, namespace)
+            if cached is not None:
+                return cached
+
         try:
-            model = genai.GenerativeModel(
-                model_name,
-                system_instruction=system_prompt
-            )
+            model = self._get_model(model_name, system_prompt)
             response = model.generate_content(prompt)
+            text = response.text
+        except Exception as e:
+            return f"An error occurred during text generation: {e}"
+
+        self._cache_store(query_embedding, text, namespace, prompt)
+        return text
+
+    async def generate_text_async(
+        self,
+        prompt: str,
+        model_name: str = "gemini-flash-latest",
+        system_prompt: str = None
+    ) -> str:
+        """
+        Async variant of generate_text, so multiple prompts can be awaited
+        concurrently instead of serializing network round-trips.
+
+        Args:
+            prompt (str): The text prompt to send to the model.
+            model_name (str, optional): The name of the model to use.
+            system_prompt (str, optional): A system instruction to guide the model.
+
+        Returns:
+            str: The generated text response from the model.
+        """
+        try:
+            model = self._get_model(model_name, system_prompt)
+            response = await model.generate_content_async(prompt)
             return response.text
         except Exception as e:
             return f"An error occurred during text generation: {e}"
 
+    async def batch_generate(
+        self,
+        prompts: List[str],
+        model_name: str = "gemini-flash-latest",
+        system_prompt: str = None,
+        max_concurrency: int = 8
+    ) -> List[str]:
+        """
+        Generates responses for many prompts concurrently.
+
+        At most max_concurrency requests are kept in flight (rate-limit
+        safety); N round-trips overlap into roughly one round-trip of
+        wall-clock time.
+
+        Args:
+            prompts (List[str]): The prompts to process.
+            model_name (str, optional): The name of the model to use.
+            system_prompt (str, optional): A system instruction to guide the model.
+            max_concurrency (int, optional): Maximum requests in flight.
+
+        Returns:
+            List[str]: Responses in the same order as the input prompts.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate_text_async(prompt, model_name, system_prompt)
+
+        return list(await asyncio.gather(*(bounded(p) for p in prompts)))
+
+    def generate_text_multi(
+        self,
+        prompts: List[str],
+        model_name: str = "gemini-flash-latest",
+        system_prompt: str = None,
+        max_input_tokens: int = 30000
+    ) -> List[str]:
+        """
+        Generates responses for many small prompts in as few requests as possible.
+
+        Prompts are packed into batches (bounded by a token budget measured via
+        count_tokens) and sent as one numbered request asking for a JSON array
+        back, amortizing the per-request network overhead over the whole batch.
+        Any batch whose response cannot be parsed falls back to individual
+        generate_text calls, so results are never silently dropped.
+
+        Args:
+            prompts (List[str]): The prompts to process.
+            model_name (str, optional): The name of the model to use.
+            system_prompt (str, optional): A system instruction to guide the model.
+            max_input_tokens (int, optional): Token budget per packed request.
+
+        Returns:
+            List[str]: Responses in the same order as the input prompts.
+        """
+        if not prompts:
+            return []
+
+        model = self._get_model(model_name, system_prompt)
+        header = (
+            "Process each numbered item below independently. "
+            "Return ONLY a JSON array of strings, one answer per item, in order."
+        )
+
+        def count_tokens(text: str) -> int:
+            try:
+                return model.count_tokens(text).total_tokens
+            except Exception:
+                # Offline/quota failure: a ~4 chars/token estimate keeps packing going.
+                return max(1, len(text) // 4)
+
+        # Greedy packing: each batch stays under the budget, and a single
+        # oversized prompt still gets a batch of its own.
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = count_tokens(header)
+        for prompt in prompts:
+            prompt_tokens = count_tokens(prompt)
+            if current and current_tokens + prompt_tokens > max_input_tokens:
+                batches.append(current)
+                current = []
+                current_tokens = count_tokens(header)
+            current.append(prompt)
+            current_tokens += prompt_tokens
+        if current:
+            batches.append(current)
+
+        results: List[str] = []
+        for batch in batches:
+            packed = "\n".join(
+                [header] + [f"[{i + 1}] {p}" for i, p in enumerate(batch)]
+            )
+            answers = None
+            try:
+                response = model.generate_content(packed)
+                text = response.text.strip()
+                # Models often wrap JSON in markdown fences; strip them first.
+                if text.startswith("```"):
+                    text = text.strip("`")
+                    if text.startswith("json"):
+                        text = text[4:]
+                parsed = json.loads(text)
+                if isinstance(parsed, list) and len(parsed) == len(batch):
+                    answers = [str(item) for item in parsed]
+            except Exception:
+                answers = None
+
+            if answers is None:
+                # Parse failure: re-run the batch as individual calls.
+                answers = [
+                    self.generate_text(p, model_name, system_prompt) for p in batch
+                ]
+            results.extend(answers)
+
+        return results
+
+    # --- SEMANTIC CACHE HELPERS ---
+
+    def _embed_prompt(self, prompt: str):
+        """Embeds a prompt for cache lookup; returns None if embedding fails."""
+        embedding = self.get_embedding(prompt, task_type="RETRIEVAL_QUERY")
+        if not embedding:
+            return None
+        return np.asarray(embedding, dtype=np.float32)
+
+    @staticmethod
+    def _normalize(vec: np.ndarray) -> np.ndarray:
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else vec
+
+    @staticmethod
+    def cosine_sim_batch(query_vec: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity between one query vector and every row of a matrix
+        whose rows are already L2-normalized. A single matrix-vector product
+        replaces per-pair similarity calls.
+
+        Args:
+            query_vec (np.ndarray): The query embedding (any norm).
+            matrix (np.ndarray): (N, D) float32 matrix of unit-norm rows.
+
+        Returns:
+            np.ndarray: The N similarity scores.
+        """
+        query_vec = LLMUtilitySuite._normalize(np.asarray(query_vec, dtype=np.float32))
+        return matrix @ query_vec
+
+    @staticmethod
+    def _cache_namespace(system_prompt, model_name) -> str:
+        """Hash of model + system prompt, so neither different personas nor
+        different models ever share hits."""
+        key = f"{model_name}\n{system_prompt or ''}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+    def _open_cache_db(self):
+        """
+        Opens (creating if needed) the persistent semantic-cache database.
+        A disk lookup is ~1ms against a ~1s LLM round-trip, so short-lived
+        scripts get cache hits from previous runs.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.CACHE_DB_PATH), exist_ok=True)
+            db = sqlite3.connect(self.CACHE_DB_PATH, check_same_thread=False)
+            # Migrate databases created before responses moved to the sidecar
+            # file: the old rows point at nothing, so drop and start fresh.
+            columns = {row[1] for row in db.execute("PRAGMA table_info(cache)")}
+            if columns and "resp_offset" not in columns:
+                db.execute("DROP TABLE cache")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "namespace TEXT, prompt TEXT, embedding BLOB, "
+                "resp_offset INTEGER, resp_length INTEGER, ts INTEGER)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS idx_cache_ns_ts ON cache(namespace, ts)")
+            db.commit()
+            return db
+        except Exception as e:
+            print(f"Semantic cache persistence disabled: {e}")
+            return None
+
+    # --- RESPONSE STORE (append-only + mmap) ---
+
+    def _open_response_store(self):
+        """
+        Opens the append-only response file. Reads go through mmap, so repeated
+        hits are zero-copy and the pages are shared by every process mapping
+        the same file (e.g. reruns of task_api_calls.py).
+        """
+        try:
+            os.makedirs(os.path.dirname(self.CACHE_BIN_PATH), exist_ok=True)
+            return open(self.CACHE_BIN_PATH, "ab")
+        except Exception as e:
+            print(f"Semantic cache response store disabled: {e}")
+            return None
+
+    def _response_store_append(self, response: str):
+        """Appends a response body and returns its (offset, length) locator."""
+        data = response.encode("utf-8")
+        self._resp_file.seek(0, os.SEEK_END)
+        offset = self._resp_file.tell()
+        self._resp_file.write(data)
+        self._resp_file.flush()
+        return offset, len(data)
+
+    def _response_store_read(self, offset: int, length: int) -> str:
+        """Reads a response body back through the shared memory map."""
+        end = offset + length
+        if self._resp_mm is None or end > len(self._resp_mm):
+            # The file only ever grows; remap when a locator points past the
+            # current mapping (i.e. rows appended since the last remap).
+            if self._resp_mm is not None:
+                self._resp_mm.close()
+            with open(self.CACHE_BIN_PATH, "rb") as handle:
+                self._resp_mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._resp_mm[offset:end].decode("utf-8")
+
+    def _cache_bucket(self, namespace: str) -> Dict:
+        """
+        Returns the in-memory bucket for a namespace, loading still-valid rows
+        from SQLite the first time the namespace is touched in this process.
+        """
+        bucket = self._cache_ns.get(namespace)
+        if bucket is not None:
+            return bucket
+
+        bucket = {"matrix": None, "responses": [], "timestamps": []}
+        self._cache_ns[namespace] = bucket
+        if self._cache_db is not None:
+            cutoff = int(time.time()) - self.CACHE_TTL_SECONDS
+            try:
+                rows = self._cache_db.execute(
+                    "SELECT embedding, resp_offset, resp_length, ts FROM cache "
+                    "WHERE namespace = ? AND ts >= ? ORDER BY ts",
+                    (namespace, cutoff)
+                ).fetchall()
+            except Exception as e:
+                print(f"Semantic cache read failed: {e}")
+                rows = []
+            for blob, offset, length, ts in rows:
+                self._bucket_append(
+                    bucket, np.frombuffer(blob, dtype=np.float32), (offset, length), ts
+                )
+        return bucket
+
+    @staticmethod
+    def _bucket_append(bucket: Dict, embedding, response, ts):
+        # Rows are normalized at insert time so lookups are a bare gemv.
+        # "response" is either an (offset, length) locator into responses.bin
+        # or, when the response store is unavailable, the raw string itself.
+        row = LLMUtilitySuite._normalize(np.asarray(embedding, dtype=np.float32))[np.newaxis, :]
+        if bucket["matrix"] is None:
+            bucket["matrix"] = row
+        else:
+            bucket["matrix"] = np.vstack((bucket["matrix"], row))
+        bucket["responses"].append(response)
+        bucket["timestamps"].append(ts)
+
+    def _cache_lookup(self, query_embedding, namespace: str):
+        """
+        Returns the cached response whose prompt embedding is most similar to
+        the query, or None if nothing clears the similarity threshold.
+        """
+        if query_embedding is None:
+            return None
+        bucket = self._cache_bucket(namespace)
+        self._evict_expired(bucket)
+        if bucket["matrix"] is None:
+            return None
+
+        sims = self.cosine_sim_batch(query_embedding, bucket["matrix"])
+        best = int(np.argmax(sims))
+        if sims[best] > self.CACHE_SIMILARITY_THRESHOLD:
+            stored = bucket["responses"][best]
+            if isinstance(stored, tuple):
+                try:
+                    return self._response_store_read(*stored)
+                except Exception as e:
+                    print(f"Semantic cache response read failed: {e}")
+                    return None
+            return stored
+        return None
+
+    def _cache_store(self, query_embedding, response: str, namespace: str, prompt: str):
+        if query_embedding is None:
+            return
+        ts = int(time.time())
+
+        locator = None
+        if self._resp_file is not None:
+            try:
+                locator = self._response_store_append(response)
+            except Exception as e:
+                print(f"Semantic cache response write failed: {e}")
+        # Without the sidecar store, keep the raw string in memory only.
+        self._bucket_append(
+            self._cache_bucket(namespace), query_embedding, locator or response, ts
+        )
+        if self._cache_db is not None and locator is not None:
+            try:
+                self._cache_db.execute(
+                    "INSERT INTO cache(namespace, prompt, embedding, resp_offset, resp_length, ts) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (namespace, prompt,
+                     np.asarray(query_embedding, dtype=np.float32).tobytes(),
+                     locator[0], locator[1], ts)
+                )
+                # Expired rows are dropped from the index; their bytes stay in
+                # the append-only file, which is fine for a dev-loop cache.
+                self._cache_db.execute(
+                    "DELETE FROM cache WHERE ts < ?", (ts - self.CACHE_TTL_SECONDS,)
+                )
+                self._cache_db.commit()
+            except Exception as e:
+                print(f"Semantic cache write failed: {e}")
+
+    def _evict_expired(self, bucket: Dict):
+        if not bucket["timestamps"]:
+            return
+        cutoff = time.time() - self.CACHE_TTL_SECONDS
+        keep = [i for i, ts in enumerate(bucket["timestamps"]) if ts >= cutoff]
+        if len(keep) == len(bucket["timestamps"]):
+            return
+        if not keep:
+            bucket["matrix"] = None
+            bucket["responses"] = []
+            bucket["timestamps"] = []
+            return
+        bucket["matrix"] = bucket["matrix"][keep]
+        bucket["responses"] = [bucket["responses"][i] for i in keep]
+        bucket["timestamps"] = [bucket["timestamps"][i] for i in keep]
+
     def start_chat(
         self,
         model_name: str = "gemini-1.5-flash"
@@ -80,7 +500,7 @@ class LLMUtilitySuite:
             A chat session object.
         """
         try:
-            model = genai.GenerativeModel(model_name)
+            model = self._get_model(model_name)
             chat = model.start_chat(history=[])
             return chat
         except Exception as e:
@@ -144,30 +564,61 @@ class LLMUtilitySuite:
         self,
         texts: List[str],
         model_name: str = "models/embedding-001",
-        task_type: str = "RETRIEVAL_DOCUMENT"
+        task_type: str = "RETRIEVAL_DOCUMENT",
+        batch_size: int = 100,
+        max_workers: int = 8
     ) -> List[List[float]]:
         """
         Generates embeddings for a batch of texts.
 
+        The input is split into chunks of at most batch_size and the chunks
+        are embedded concurrently: each request is network-bound, so
+        overlapping them hides latency while keeping every single request
+        under the service-side batch limit.
+
         Args:
             texts (List[str]): A list of texts to embed.
             model_name (str, optional): The embedding model to use.
             task_type (str, optional): The intended task for the embeddings.
+            batch_size (int, optional): Maximum texts per API request.
+            max_workers (int, optional): Concurrent requests in flight.
 
         Returns:
-            A list of embedding vectors.
+            A list of embedding vectors, in the same order as the input.
         """
+        if not texts:
+            return []
+
+        def embed_chunk(chunk: List[str]) -> List[List[float]]:
+            # Exponential backoff on rate-limit responses only.
+            delay = 1.0
+            for attempt in range(4):
+                try:
+                    result = genai.embed_content(
+                        model=model_name,
+                        content=chunk,
+                        task_type=task_type
+                    )
+                    return result['embedding']
+                except Exception as e:
+                    message = str(e).lower()
+                    retryable = any(k in message for k in ("429", "quota", "exhausted"))
+                    if attempt == 3 or not retryable:
+                        raise
+                    time.sleep(delay)
+                    delay *= 2
+
+        chunks = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
         try:
-            result = genai.embed_content(
-                model=model_name,
-                content=texts,
-                task_type=task_type
-            )
-            return result['embedding']
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                # executor.map preserves chunk order, so input order is kept
+                per_chunk = list(executor.map(embed_chunk, chunks))
         except Exception as e:
             print(f"An error occurred during batch embedding: {e}")
             return []
 
+        return [embedding for chunk_result in per_chunk for embedding in chunk_result]
+
     # --- UTILITY METHOD ---
 
     @staticmethod
@@ -196,19 +647,23 @@ class LLMUtilitySuite:
             return []
 
     @staticmethod
-    def calculate_cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
+    def calculate_cosine_similarity(
+        vec1: Union[List[float], np.ndarray],
+        vec2: Union[List[float], np.ndarray]
+    ) -> float:
         """
         Calculates the cosine similarity between two embedding vectors.
 
         Args:
-            vec1 (List[float]): The first embedding vector.
-            vec2 (List[float]): The second embedding vector.
+            vec1 (List[float] | np.ndarray): The first embedding vector.
+            vec2 (List[float] | np.ndarray): The second embedding vector.
 
         Returns:
             The cosine similarity score (from -1 to 1).
         """
-        if not vec1 or not vec2:
+        # asarray is a no-op for inputs that are already arrays
+        vec1 = np.asarray(vec1, dtype=np.float32)
+        vec2 = np.asarray(vec2, dtype=np.float32)
+        if vec1.size == 0 or vec2.size == 0:
             return 0.0
-        vec1 = np.array(vec1)
-        vec2 = np.array(vec2)
-        return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
+        return float(np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2)))
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""Logica de analiză Librosa partajată de varianta CLI și de cea GUI.
+
+Constantele (tabelul Camelot, șabloanele de gamă, matricile de rotații) se
+construiesc o singură dată la import și sunt refolosite de ambele puncte de
+intrare, în loc să fie duplicate în fiecare script.
+"""
+import os
+import sys
+from math import gcd
+
+# Plafonul BLAS trebuie aplicat ÎNAINTE de importul numpy: OpenBLAS/MKL își
+# citesc variabilele doar la încărcarea bibliotecii, iar workerii porniți prin
+# fork moștenesc pool-urile de thread-uri deja inițializate — setarea lor mai
+# târziu ar fi un no-op (vezi limit_blas_threads)
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
+import numpy as np
+from scipy.signal import resample_poly
+
+# --- DEPENDENȚE LIBROSA ---
+# Ne asiguram ca s-a instalat totul din requirements.txt
+try:
+    import librosa
+    import librosa.beat
+    import soundfile as sf
+except ImportError:
+    print("EROARE: Lipsește librosa. Rulează: pip install -r requirements.txt")
+    sys.exit(1)
+
+# --- NUMBA (opțional) ---
+# Kernelul de detecție a gamei e compilat nativ dacă numba e instalat;
+# altfel cădem pe varianta vectorizată NumPy.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Tabelul de traducere Camelot
+CAMELOT_WHEEL = {
+    'C': ('8B', '5A'), 'G': ('9B', '6A'), 'D': ('10B', '7A'), 'A': ('11B', '8A'),
+    'E': ('12B', '9A'), 'B': ('1B', '10A'), 'F#': ('2B', '11A'), 'Db': ('3B', '12A'),
+    'Ab': ('4B', '1B'), 'Eb': ('5B', '2A'), 'Bb': ('6B', '3A'), 'F': ('7B', '4A'),
+    'C#': ('3B', '12A'), 'D#': ('5B', '2A'), 'G#': ('4B', '1B'), 'A#': ('6B', '3A'),
+    'Am': ('8B', '5A'), 'Em': ('9B', '6A'), 'Bm': ('10B', '7A'), 'F#m': ('11B', '8A'),
+    'C#m': ('12B', '9A'), 'G#m': ('1B', '10A'), 'D#m': ('2B', '11A'), 'A#m': ('3B', '12A'),
+    'Fm': ('4B', '1B'), 'Cm': ('5B', '2A'), 'Gm': ('6B', '3A'), 'Dm': ('7B', '4A')
+}
+
+# Tabelul aplatizat ("Cmaj"/"Cmin" -> cod Camelot), construit o dată la import,
+# astfel încât traducerea devine o singură căutare în dict
+KEY_TO_CAMELOT = {}
+for _base, (_maj_code, _min_code) in CAMELOT_WHEEL.items():
+    KEY_TO_CAMELOT[f"{_base}maj"] = _maj_code
+    KEY_TO_CAMELOT[f"{_base}min"] = _min_code
+
+# Maparea notelor standard
+NOTES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
+
+# Șabloanele Krumhansl pentru gama majoră (Do) și minoră (La)
+C_MAJOR_TEMPLATE = np.array([6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88])
+A_MINOR_TEMPLATE = np.array([6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 4.20])
+
+
+def _build_rotation_matrix(template: np.ndarray) -> np.ndarray:
+    """Construiește matricea (12, 12) cu toate rotațiile șablonului, centrate și normalizate L2."""
+    rots = np.stack([np.roll(template, i) for i in range(12)]).astype(np.float64)
+    rots -= rots.mean(axis=1, keepdims=True)
+    rots /= np.linalg.norm(rots, axis=1, keepdims=True)
+    # float32 contiguu: 576 de octeți per matrice, jumătate din lățimea de bandă
+    # și dublul debitului SIMD față de float64
+    return np.ascontiguousarray(rots, dtype=np.float32)
+
+
+# Precomputate o singură dată la import: corelația cu toate rotațiile devine o înmulțire de matrice
+MAJOR_ROTS = _build_rotation_matrix(C_MAJOR_TEMPLATE)
+MINOR_ROTS = _build_rotation_matrix(A_MINOR_TEMPLATE)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _detect_key_jit(chroma_vec, maj_rots, min_rots):
+        """Kernel nativ: centrare, normalizare și cele 24 de corelații, fără alocări NumPy."""
+        n = chroma_vec.shape[0]
+        mean = 0.0
+        for i in range(n):
+            mean += chroma_vec[i]
+        mean /= n
+
+        cv = np.empty(n)
+        norm = 0.0
+        for i in range(n):
+            cv[i] = chroma_vec[i] - mean
+            norm += cv[i] * cv[i]
+        norm = norm ** 0.5
+        if norm == 0.0:
+            norm = 1.0
+
+        best_maj = -2.0
+        best_min = -2.0
+        maj_idx = 0
+        min_idx = 0
+        for r in range(12):
+            acc_maj = 0.0
+            acc_min = 0.0
+            for i in range(n):
+                acc_maj += maj_rots[r, i] * cv[i]
+                acc_min += min_rots[r, i] * cv[i]
+            if acc_maj > best_maj:
+                best_maj = acc_maj
+                maj_idx = r
+            if acc_min > best_min:
+                best_min = acc_min
+                min_idx = r
+
+        is_major = (best_maj / norm) >= (best_min / norm)
+        return (maj_idx if is_major else min_idx), is_major
+else:
+    _detect_key_jit = None
+
+
+def detect_key(chroma_vector: np.ndarray):
+    """Întoarce (indexul notei, este_majoră) pentru vectorul chroma mediu."""
+    if _detect_key_jit is not None:
+        best_idx, is_major = _detect_key_jit(
+            np.ascontiguousarray(chroma_vector, dtype=np.float32),
+            MAJOR_ROTS, MINOR_ROTS
+        )
+        return int(best_idx), bool(is_major)
+
+    # Varianta NumPy: două produse matrice-vector + argmax, totul în float32
+    cv = chroma_vector - chroma_vector.mean()
+    cv_norm = np.linalg.norm(cv)
+    if cv_norm > 0:
+        cv = cv / cv_norm
+    cv = cv.astype(np.float32, copy=False)
+    corrs_maj = MAJOR_ROTS @ cv
+    corrs_min = MINOR_ROTS @ cv
+
+    maj_idx = int(np.argmax(corrs_maj))
+    min_idx = int(np.argmax(corrs_min))
+    is_major = bool(corrs_maj[maj_idx] >= corrs_min[min_idx])
+    return (maj_idx if is_major else min_idx), is_major
+
+
+if _detect_key_jit is not None:
+    # Warm-start: compilarea JIT are loc la import, nu la primul fișier din lot
+    detect_key(np.ones(12))
+
+
+def limit_blas_threads() -> None:
+    """Evită suprasubscrierea BLAS/OpenMP când rulăm câte un proces per nucleu.
+
+    Plafonul efectiv se aplică la importul acestui modul, înainte de numpy
+    (bibliotecile BLAS citesc variabilele doar la încărcare). Funcția rămâne
+    punctul de apel explicit al CLI/GUI și re-aplică variabilele pentru cazul
+    în care au fost șterse din mediu între timp.
+    """
+    for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(var, "1")
+
+
+def get_camelot_code(key: str) -> str:
+    """Traduce o cheie tehnică (ex: 'C#min') în cod Camelot (ex: '12A')"""
+    return KEY_TO_CAMELOT.get(key, "N/A")
+
+
+def get_detailed_mood(bpm: int, is_major: bool) -> str:
+    """
+    NOU: Combină BPM (Arousal) și Gama (Valență) pentru a returna un mood detaliat.
+    Acesta este Modelul Circumplex (Matricea de Stări).
+    """
+    if is_major:
+        # --- AXA POZITIVĂ (Gamă Majoră) ---
+        if bpm > 130:
+            return "Euforic / Petrecere (Arousal Ridicat)"
+        elif bpm > 95:
+            return "Vesel / Optimist (Arousal Mediu)"
+        else:
+            return "Calm / Liniștit (Arousal Scăzut)"
+    else:
+        # --- AXA NEGATIVĂ (Gamă Minoră) ---
+        if bpm > 125:
+            return "Tensionat / Agresiv (Arousal Ridicat)"
+        elif bpm > 90:
+            return "Melancolic / Nostalgic (Arousal Mediu)"
+        else:
+            return "Trist / Întunecat (Arousal Scăzut)"
+
+
+# 22050 Hz e suficient pentru BPM și gamă; înjumătățește costul FFT la surse de 44.1kHz
+TARGET_SR = 22050
+
+
+def _load_audio(file_path: str):
+    """Încarcă un fișier audio ca float32 mono la TARGET_SR.
+
+    Citim direct prin libsndfile (soundfile): fără logica de fallback audioread
+    din librosa.load și fără conversia de tip per apel — datele vin deja float32.
+    Reeșantionarea se face polifazic (resample_poly), mult mai ieftin decât
+    resamplerul implicit din librosa. Pentru formatele pe care libsndfile nu le
+    decodează cădem înapoi pe librosa.load.
+    """
+    try:
+        data, sr_orig = sf.read(file_path, dtype='float32', always_2d=False)
+    except RuntimeError:
+        return librosa.load(file_path, sr=TARGET_SR, mono=True)
+
+    y = data.mean(axis=1) if data.ndim == 2 else data
+    if sr_orig != TARGET_SR:
+        divisor = gcd(TARGET_SR, sr_orig)
+        y = resample_poly(y, TARGET_SR // divisor, sr_orig // divisor)
+        y = y.astype(np.float32, copy=False)
+    return y, TARGET_SR
+
+
+def analyze_audio_file_logic(file_path: str) -> dict:
+    """Funcția care rulează calculele Librosa și returnează un dicționar de rezultate."""
+
+    y, sr = _load_audio(file_path)
+
+    # Poartă rapidă de liniște: un singur produs scalar peste semnal evită întreaga
+    # analiză CQT pentru fișiere mute, goale sau mai scurte de o secundă
+    rms = np.sqrt(np.mean(y * y, dtype=np.float64)) if len(y) else 0.0
+    if rms < 1e-4 or len(y) < sr:
+        return {
+            "bpm": 0,
+            "key_technical": "N/A",
+            "key_camelot": "N/A",
+            "valence": "N/A",
+            "mood_detailed": "N/A (semnal absent sau prea scurt)"
+        }
+
+    # Spectrograma CQT se calculează O SINGURĂ DATĂ și e refolosită de ambele analize
+    C = np.abs(librosa.cqt(y=y, sr=sr))
+
+    # 1. DETECTAREA BPM (anvelopa de onset derivată din CQT, fără un al doilea spectrogram)
+    onset_env = librosa.onset.onset_strength(S=librosa.amplitude_to_db(C, ref=np.max), sr=sr)
+    tempo, _ = librosa.beat.beat_track(onset_envelope=onset_env, sr=sr)
+    bpm = int(tempo[0])  # Corecția __round__
+
+    # 2. DETECTAREA GAMEI (Cheia Muzicală) — folosește CQT-ul deja calculat.
+    # CQT-ul partajat are binii impliciți librosa.cqt (12/octavă, 7 octave);
+    # chroma_cens presupune 36/octavă pentru un C dat de utilizator, deci
+    # parametrii trebuie declarați explicit, altfel vectorul chroma iese amestecat
+    chroma = librosa.feature.chroma_cens(C=C, sr=sr, bins_per_octave=12, n_octaves=7)
+    chroma_vector = np.mean(chroma, axis=1)
+
+    # Corelația Pearson cu toate cele 24 de rotații, într-un singur kernel
+    # (nativ Numba dacă e disponibil, altfel două produse matrice-vector)
+    best_idx, is_major = detect_key(chroma_vector)
+    best_key = NOTES[best_idx] + ("maj" if is_major else "min")
+
+    camelot_code = get_camelot_code(best_key)
+    valence_simple = "Pozitivă (Major)" if is_major else "Negativă (Minor)"
+
+    # --- MODIFICARE: Apelăm noua funcție de detaliere a emoției ---
+    mood_detailed = get_detailed_mood(bpm, is_major)
+
+    return {
+        "bpm": bpm,
+        "key_technical": best_key,
+        "key_camelot": camelot_code,
+        "valence": valence_simple,  # Păstrăm și valența simplă
+        "mood_detailed": mood_detailed  # Adăugăm noul mood detaliat
+    }
+
+
+if __name__ == "__main__":
+    # Verificare de regresie (rulează cu: python _analysis.py): un acord Do
+    # major sintetic trece prin întregul pipeline CQT -> chroma -> detect_key
+    # și trebuie să iasă Cmaj; prinde orice nepotrivire de parametri între
+    # CQT-ul partajat și chroma_cens
+    import tempfile
+
+    t = np.arange(int(3.0 * TARGET_SR)) / TARGET_SR
+    tone = sum(np.sin(2 * np.pi * f * t) for f in (261.63, 329.63, 392.00))
+    tone = (0.5 * tone / np.max(np.abs(tone))).astype(np.float32)
+
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as fh:
+        tmp_wav = fh.name
+    try:
+        sf.write(tmp_wav, tone, TARGET_SR)
+        result = analyze_audio_file_logic(tmp_wav)
+    finally:
+        os.unlink(tmp_wav)
+
+    assert result["key_technical"] == "Cmaj", (
+        f"Regresie detect_key: așteptat Cmaj, obținut {result['key_technical']}"
+    )
+    print("OK: acordul sintetic Do major -> Cmaj")
@@ -6,8 +6,9 @@ Interfață pentru a selecta MULTIPLE fișiere audio și a le extrage BPM, Gamă
 import sys
 import os
 import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-import numpy as np
 
 # --- DEPENDENȚE GUI ---
 from PyQt6.QtWidgets import (
@@ -16,113 +17,12 @@ from PyQt6.QtWidgets import (
     QListWidgetItem
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-
-# --- DEPENDENȚE LIBROSA ---
-# Ne asiguram ca s-a instalat totul din requirements.txt
-try:
-    import librosa
-    import librosa.beat
-    import soundfile as sf
-except ImportError:
-    print("EROARE: Lipsește librosa. Rulează: pip install -r requirements.txt")
-    sys.exit(1)
+from PyQt6.QtGui import QTextCursor
 
 # ----------------------------------------------------
-# 1. LOGICA DE ANALIZĂ LIBROSA
+# 1. LOGICA DE ANALIZĂ LIBROSA (partajată cu varianta CLI)
 # ----------------------------------------------------
-
-# Tabelul de traducere Camelot
-CAMELOT_WHEEL = {
-    'C': ('8B', '5A'), 'G': ('9B', '6A'), 'D': ('10B', '7A'), 'A': ('11B', '8A'),
-    'E': ('12B', '9A'), 'B': ('1B', '10A'), 'F#': ('2B', '11A'), 'Db': ('3B', '12A'),
-    'Ab': ('4B', '1B'), 'Eb': ('5B', '2A'), 'Bb': ('6B', '3A'), 'F': ('7B', '4A'),
-    'C#': ('3B', '12A'), 'D#': ('5B', '2A'), 'G#': ('4B', '1B'), 'A#': ('6B', '3A'),
-    'Am': ('8B', '5A'), 'Em': ('9B', '6A'), 'Bm': ('10B', '7A'), 'F#m': ('11B', '8A'),
-    'C#m': ('12B', '9A'), 'G#m': ('1B', '10A'), 'D#m': ('2B', '11A'), 'A#m': ('3B', '12A'),
-    'Fm': ('4B', '1B'), 'Cm': ('5B', '2A'), 'Gm': ('6B', '3A'), 'Dm': ('7B', '4A')
-}
-
-# Maparea notelor standard
-NOTES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-
-
-def get_camelot_code(key: str) -> str:
-    """Traduce o cheie tehnică (ex: 'C#min') în cod Camelot (ex: '12A')"""
-    if key.endswith('maj'):
-        base_key = key[:-3]
-        return CAMELOT_WHEEL.get(base_key, ('N/A', 'N/A'))[0]
-    elif key.endswith('min'):
-        base_key = key[:-3]
-        return CAMELOT_WHEEL.get(base_key, ('N/A', 'N/A'))[1]
-    return "N/A"
-
-
-def get_detailed_mood(bpm: int, is_major: bool) -> str:
-    """
-    NOU: Combină BPM (Arousal) și Gama (Valență) pentru a returna un mood detaliat.
-    Acesta este Modelul Circumplex (Matricea de Stări).
-    """
-    if is_major:
-        # --- AXA POZITIVĂ (Gamă Majoră) ---
-        if bpm > 130:
-            return "Euforic / Petrecere (Arousal Ridicat)"
-        elif bpm > 95:
-            return "Vesel / Optimist (Arousal Mediu)"
-        else:
-            return "Calm / Liniștit (Arousal Scăzut)"
-    else:
-        # --- AXA NEGATIVĂ (Gamă Minoră) ---
-        if bpm > 125:
-            return "Tensionat / Agresiv (Arousal Ridicat)"
-        elif bpm > 90:
-            return "Melancolic / Nostalgic (Arousal Mediu)"
-        else:
-            return "Trist / Întunecat (Arousal Scăzut)"
-
-
-def analyze_audio_file_logic(file_path: str) -> dict:
-    """Funcția care rulează calculele Librosa și returnează un dicționar de rezultate."""
-
-    y, sr = librosa.load(file_path, sr=None, mono=True)
-
-    # 1. DETECTAREA BPM
-    tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
-    bpm = int(tempo[0])  # Corecția __round__
-
-    # 2. DETECTAREA GAMEI (Cheia Muzicală)
-    chroma = librosa.feature.chroma_cens(y=y, sr=sr)
-    chroma_vector = np.mean(chroma, axis=1)
-
-    C_major_template = np.array([6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88])
-    A_minor_template = np.array([6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 4.20])
-
-    best_key = "Necunoscut"
-    best_correlation = -1
-    is_major = False
-
-    for i in range(12):
-        corr_maj = np.corrcoef(chroma_vector, np.roll(C_major_template, i))[0, 1]
-        corr_min = np.corrcoef(chroma_vector, np.roll(A_minor_template, i))[0, 1]
-
-        if corr_maj > best_correlation or corr_min > best_correlation:
-            is_major = corr_maj > corr_min
-            best_correlation = max(corr_maj, corr_min)
-            best_key = NOTES[i]
-            best_key += "maj" if is_major else "min"
-
-    camelot_code = get_camelot_code(best_key)
-    valence_simple = "Pozitivă (Major)" if is_major else "Negativă (Minor)"
-
-    # --- MODIFICARE: Apelăm noua funcție de detaliere a emoției ---
-    mood_detailed = get_detailed_mood(bpm, is_major)
-
-    return {
-        "bpm": bpm,
-        "key_technical": best_key,
-        "key_camelot": camelot_code,
-        "valence": valence_simple,  # Păstrăm și valența simplă
-        "mood_detailed": mood_detailed  # Adăugăm noul mood detaliat
-    }
+from _analysis import analyze_audio_file_logic, limit_blas_threads
 
 
 # ----------------------------------------------------
@@ -131,10 +31,15 @@ def analyze_audio_file_logic(file_path: str) -> dict:
 
 class BatchAnalysisWorker(QThread):
 
-    file_processed = pyqtSignal(dict)  # Emite după fiecare fișier
+    files_processed = pyqtSignal(list)  # Emite LOTURI de rezultate, nu per fișier
     batch_complete = pyqtSignal(int, int)  # Emite la final (succes, eșecuri)
     analysis_error = pyqtSignal(str)
 
+    # Jurnalul GUI se actualizează per lot (N fișiere sau interval scurs), astfel
+    # încât QTextEdit nu mai face câte un re-layout pentru fiecare fișier
+    FLUSH_EVERY_N = 10
+    FLUSH_INTERVAL_SEC = 0.5
+
     def __init__(self, file_paths: list):  #Primește o listă de fișiere
         super().__init__()
         self.file_paths = file_paths
@@ -147,21 +52,43 @@ class BatchAnalysisWorker(QThread):
         successful_files = 0
         failed_files = 0
 
-        for file_path in self.file_paths:
-            if not self._is_running:
-                break
-
-            try:
-                # Rulează funcția de analiză Librosa
-                results = analyze_audio_file_logic(file_path)
-                results['file_name'] = Path(file_path).name  # Adaugă numele fișierului la rezultate
-                self.file_processed.emit(results)
-                successful_files += 1
-            except Exception as e:
-                # Emite eroarea, dar continuă cu următorul fișier
-                error_msg = f"Eroare la procesarea {Path(file_path).name}: {e}"
-                self.analysis_error.emit(error_msg)
-                failed_files += 1
+        # Analiza e independentă per fișier -> rulăm în paralel, un proces per nucleu,
+        # și emitem rezultatele pe măsură ce se termină
+        limit_blas_threads()
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(analyze_audio_file_logic, file_path): file_path
+                for file_path in self.file_paths
+            }
+            buffered_results = []
+            last_flush = time.monotonic()
+            for future in as_completed(futures):
+                if not self._is_running:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+                file_path = futures[future]
+                try:
+                    results = future.result()
+                    results['file_name'] = Path(file_path).name  # Adaugă numele fișierului la rezultate
+                    buffered_results.append(results)
+                    successful_files += 1
+                except Exception as e:
+                    # Emite eroarea, dar continuă cu următorul fișier
+                    error_msg = f"Eroare la procesarea {Path(file_path).name}: {e}"
+                    self.analysis_error.emit(error_msg)
+                    failed_files += 1
+
+                now = time.monotonic()
+                if len(buffered_results) >= self.FLUSH_EVERY_N or (
+                        buffered_results and now - last_flush >= self.FLUSH_INTERVAL_SEC):
+                    self.files_processed.emit(buffered_results)
+                    buffered_results = []
+                    last_flush = now
+
+            if buffered_results:
+                self.files_processed.emit(buffered_results)
 
         if self._is_running:
             # Emite semnalul de finalizare doar dacă nu a fost oprit manual
@@ -231,6 +158,9 @@ class LibrosaBatchGUI(QMainWindow):
         results_vbox.addWidget(QLabel("Rezultate (Jurnal):", styleSheet="font-weight: bold;"))
         self.results_text = QTextEdit()
         self.results_text.setReadOnly(True)
+        # Jurnal mărginit: Qt păstrează doar ultimele N blocuri, deci memoria și
+        # costul de re-layout nu mai cresc liniar cu numărul de fișiere analizate
+        self.results_text.document().setMaximumBlockCount(1000)
         self.results_text.setStyleSheet("background-color: #2e2e2e; color: #f0f0f0; font-family: 'Consolas';")
         results_vbox.addWidget(self.results_text)
         lists_layout.addLayout(results_vbox)
@@ -288,7 +218,7 @@ class LibrosaBatchGUI(QMainWindow):
 
         # Porneste Worker-ul de Analiză (cu lista de fișiere)
         self.worker_thread = BatchAnalysisWorker(self.file_paths)
-        self.worker_thread.file_processed.connect(self._handle_file_result)
+        self.worker_thread.files_processed.connect(self._handle_file_results)
         self.worker_thread.batch_complete.connect(self._handle_batch_complete)
         self.worker_thread.analysis_error.connect(self._display_error)
         self.worker_thread.start()
@@ -300,18 +230,24 @@ class LibrosaBatchGUI(QMainWindow):
             self.status_label.setText("Oprire solicitată... Se finalizează fișierul curent.")
             self.stop_button.setEnabled(False)
 
-    def _handle_file_result(self, results: dict):
-        """Afișează rezultatul pentru UN FIȘIER în jurnal (log)."""
-        output = (
-            f"--- Rezultat pentru: {results['file_name']} ---\n"
-            f"  BPM (Energie):\t{results['bpm']} BPM\n"
-            f"  Gamă (Cheie):\t\t{results['key_technical']}\n"
-            f"  Camelot (Mixaj):\t{results['key_camelot']}\n"
-            f"  Valență (Simplă):\t{results['valence']}\n"
-            f"  MOOD DETALIAT:\t{results['mood_detailed']}\n"
-            f"{'-' * 40}\n"
-        )
-        self.results_text.append(output)  # Folosim append() pentru a adăuga la log
+    def _handle_file_results(self, results_batch: list):
+        """Afișează un LOT de rezultate în jurnal (log), cu un singur re-layout."""
+        self.results_text.setUpdatesEnabled(False)
+        try:
+            for results in results_batch:
+                output = (
+                    f"--- Rezultat pentru: {results['file_name']} ---\n"
+                    f"  BPM (Energie):\t{results['bpm']} BPM\n"
+                    f"  Gamă (Cheie):\t\t{results['key_technical']}\n"
+                    f"  Camelot (Mixaj):\t{results['key_camelot']}\n"
+                    f"  Valență (Simplă):\t{results['valence']}\n"
+                    f"  MOOD DETALIAT:\t{results['mood_detailed']}\n"
+                    f"{'-' * 40}\n"
+                )
+                self.results_text.append(output)  # Folosim append() pentru a adăuga la log
+        finally:
+            self.results_text.setUpdatesEnabled(True)
+        self.results_text.moveCursor(QTextCursor.MoveOperation.End)
 
     def _handle_batch_complete(self, successful: int, failed: int):
         """Se apelează când tot lotul este gata."""
@@ -10,59 +10,128 @@ Usage (Linux/Mac):
 
 Dependencies:
   sudo apt install ffmpeg
-  pip install faster-whisper SpeechRecognition pydub openai
+  pip install faster-whisper SpeechRecognition soundfile openai
 """
 
+import functools
+import hashlib
+import heapq
 import os
 import json
+import queue
 import time
 import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
+# optional: serializare JSON nativa (emite direct UTF-8, ~5-10x mai rapida
+# pe transcrieri lungi); cadem pe json din stdlib daca lipseste
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ==================== small utilities ====================
 
-def audio_duration_sec(wav_path: Path) -> float:
-    """Intoarce durata WAV in secunde (folosind soundfile sau pydub)."""
+@functools.lru_cache(maxsize=256)
+def _duration_cached(path_str: str, mtime_ns: int, size: int) -> float:
+    # sf.info citeste doar header-ul (milisecunde, nu decodare completa);
+    # ffprobe acopera formatele pe care libsndfile nu le deschide
     try:
         import soundfile as sf
-        with sf.SoundFile(str(wav_path)) as f:
-            return float(len(f)) / float(f.samplerate)
+        info = sf.info(path_str)
+        return float(info.frames) / float(info.samplerate)
     except Exception:
         try:
-            from pydub import AudioSegment
-            return float(len(AudioSegment.from_wav(str(wav_path)))) / 1000.0
+            out = subprocess.run(
+                ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+                 "-of", "default=noprint_wrappers=1:nokey=1", path_str],
+                capture_output=True, text=True, timeout=30
+            )
+            return float(out.stdout.strip())
         except Exception:
             return 0.0
 
+def audio_duration_sec(wav_path: Path) -> float:
+    """Intoarce durata in secunde; rezultatul e cache-uit pe (cale, mtime, size)."""
+    try:
+        st = wav_path.stat()
+    except OSError:
+        return 0.0
+    return _duration_cached(str(wav_path), st.st_mtime_ns, st.st_size)
+
 def split_wav_to_chunks(wav_path: Path, max_sec: int = 600, overlap_sec: float = 0.0):
     """
     Taie WAV-ul in bucati de max_sec (default 10 min), cu overlap optional.
     Returneaza lista [(chunk_path, start_sec, end_sec), ...].
+
+    Foloseste ffmpeg cu stream-copy (fara decodare): memoria ramane O(chunk),
+    nu O(fisier intreg) ca la varianta pydub care tinea tot PCM-ul in RAM.
     """
-    from pydub import AudioSegment
     tmp_dir = wav_path.parent / ".tmp_transcriber"
     ensure_dir(tmp_dir)
 
-    audio = AudioSegment.from_wav(str(wav_path))
-    total_ms = len(audio)
-    step_ms = int((max_sec - overlap_sec) * 1000)
-    win_ms = int(max_sec * 1000)
+    total_sec = audio_duration_sec(wav_path)
+    stem = sanitize_filename(wav_path.stem)
 
+    # partile ramase de la o rulare anterioara intrerupta (acelasi stem) ar fi
+    # culese de glob-ul de mai jos cu offseturi gresite; le stergem intai
+    for stale in tmp_dir.iterdir():
+        if stale.name.startswith(f"{stem}.part_"):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+    if overlap_sec <= 0:
+        # segment muxer: o singura trecere, fara decode/re-encode
+        pattern = tmp_dir / f"{stem}.part_%03d.wav"
+        cmd = [
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+            "-i", str(wav_path), "-f", "segment",
+            "-segment_time", str(max_sec), "-c", "copy", str(pattern)
+        ]
+        try:
+            subprocess.run(cmd, check=True, text=True, capture_output=True, timeout=900)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg split failed: {e.stderr or e}")
+        except subprocess.TimeoutExpired:
+            raise RuntimeError("FFmpeg split timeout (>15min)")
+        parts = sorted(p for p in tmp_dir.iterdir() if p.name.startswith(f"{stem}.part_"))
+        chunks = []
+        for i, out in enumerate(parts):
+            start = float(i * max_sec)
+            end = min(start + max_sec, total_sec) if total_sec else start + max_sec
+            chunks.append((out, start, end))
+        return chunks
+
+    # cu overlap nu putem folosi segment muxer-ul; taiem fereastra cu -ss/-t,
+    # tot stream-copy, deci tot fara decodare
+    step = max_sec - overlap_sec
     chunks = []
     i = 1
-    for start_ms in range(0, total_ms, step_ms):
-        end_ms = min(start_ms + win_ms, total_ms)
-        piece = audio[start_ms:end_ms]
-        out = tmp_dir / f"{sanitize_filename(wav_path.stem)}.part_{i:03d}.wav"
-        piece.export(out, format="wav")
-        chunks.append((out, start_ms/1000.0, end_ms/1000.0))
+    start = 0.0
+    while start < total_sec:
+        end = min(start + max_sec, total_sec)
+        out = tmp_dir / f"{stem}.part_{i:03d}.wav"
+        cmd = [
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+            "-ss", str(start), "-t", str(max_sec),
+            "-i", str(wav_path), "-c", "copy", str(out)
+        ]
+        try:
+            subprocess.run(cmd, check=True, text=True, capture_output=True, timeout=900)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg split failed: {e.stderr or e}")
+        chunks.append((out, start, end))
         i += 1
-        if end_ms >= total_ms:
+        if end >= total_sec:
             break
+        start += step
     return chunks
 
 
@@ -74,11 +143,11 @@ def ensure_dir(p: Path) -> Path:
     p.mkdir(parents=True, exist_ok=True)
     return p
 
+# tabel construit o singura data: o trecere translate() in loc de noua replace()
+_SANITIZE_TBL = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
 def sanitize_filename(name: str) -> str:
-    invalid = '<>:"/\\|?*'
-    for ch in invalid:
-        name = name.replace(ch, "_")
-    return name.strip()
+    return name.translate(_SANITIZE_TBL).strip()
 
 def validate_audio_file(path: Path):
     if not path.exists():
@@ -92,29 +161,77 @@ def validate_audio_file(path: Path):
     return True, ""
 
 def keep_last_n_transcripts(root: Path, n: int = 3) -> int:
-    files = sorted(root.rglob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    # o singura trecere scandir (DirEntry.stat e cache-uit din readdir) si
+    # heapq.nlargest in loc de sortare completa: O(N) pentru cele n cele mai noi
+    entries = []
+
+    def _walk(d):
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        # directoarele ascunse (.api_cache, .tmp_transcriber) nu
+                        # contin transcrieri: nu concureaza la cota de pastrare
+                        # si nu trebuie sterse aici
+                        if not e.name.startswith("."):
+                            _walk(e.path)
+                    elif e.name.endswith(".json"):
+                        try:
+                            entries.append((e.stat().st_mtime, e.path))
+                        except OSError:
+                            pass
+        except OSError:
+            pass
+
+    _walk(str(root))
+    keep = {p for _, p in heapq.nlargest(n, entries)}
     removed = 0
-    for f in files[n:]:
+    for _, p in entries:
+        if p in keep:
+            continue
         try:
-            f.unlink(missing_ok=True)
-            srt = f.with_suffix(".srt")
-            if srt.exists():
-                srt.unlink(missing_ok=True)
+            os.unlink(p)
+            srt = os.path.splitext(p)[0] + ".srt"
+            if os.path.exists(srt):
+                os.unlink(srt)
             removed += 1
-        except Exception:
+        except OSError:
             pass
     return removed
 
 def cleanup_temp_files(root: Path):
-    for pat in ("*.tmp*.wav", "*.chunk_*.wav"):
-        for f in root.rglob(pat):
-            try: f.unlink(missing_ok=True)
-            except Exception: pass
+    # o singura parcurgere os.walk (in loc de doua rglob-uri) si verificari de
+    # sufix pe string, fara cate un obiect Path per intrare
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            if name.endswith(".wav") and (".tmp" in name or ".chunk_" in name):
+                try:
+                    os.unlink(os.path.join(dirpath, name))
+                except OSError:
+                    pass
+
+# cheile emise de `ffmpeg -progress`; restul liniilor de pe stderr sunt erori
+_FF_PROGRESS_KEYS = {
+    "frame", "fps", "bitrate", "total_size", "out_time_us", "out_time_ms",
+    "out_time", "dup_frames", "drop_frames", "speed", "progress"
+}
 
-def run_ffmpeg_wav16k(src: Path, denoise: bool) -> Path:
+def run_ffmpeg_wav16k(src: Path, denoise: bool, progress_cb=None) -> Path:
     """
     Convert source to 16kHz mono WAV (temp file), optional denoise.
+    Daca sursa e deja WAV 16kHz mono si nu e cerut denoise, se intoarce chiar
+    sursa (apelantii sterg doar fisiere temporare, diferite de sursa).
+    `progress_cb(sec)` este apelat pe masura ce ffmpeg avanseaza.
     """
+    if not denoise and src.suffix.lower() == ".wav":
+        try:
+            import soundfile as sf
+            info = sf.info(str(src))
+            if info.samplerate == 16000 and info.channels == 1:
+                return src
+        except Exception:
+            pass
+
     tmp_dir = src.parent / ".tmp_transcriber"
     ensure_dir(tmp_dir)
     out = tmp_dir / f"{sanitize_filename(src.stem)}_{int(time.time()*1000)}.wav"
@@ -122,35 +239,101 @@ def run_ffmpeg_wav16k(src: Path, denoise: bool) -> Path:
     af = "highpass=f=100,lowpass=f=6000,dynaudnorm=f=150:g=15" if denoise else "anull"
     cmd = [
         "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+        "-progress", "pipe:2", "-nostats",
         "-i", str(src), "-ac", "1", "-ar", "16000",
-        "-af", af if denoise else "anull",
+        "-af", af,
+        "-threads", "0", "-filter_threads", str(os.cpu_count() or 2),
         str(out)
     ]
+    # stderr se dreneaza in timp real: nu se mai poate umple pipe-ul pe filtre
+    # vorbarete, iar progresul (out_time_ms) ajunge la UI in timpul rularii
+    proc = subprocess.Popen(cmd, stderr=subprocess.PIPE, text=True)
+    err_lines = []
+
+    def _drain():
+        for line in proc.stderr:
+            line = line.strip()
+            if not line:
+                continue
+            key = line.split("=", 1)[0]
+            if key in _FF_PROGRESS_KEYS or key.startswith("stream_"):
+                if key == "out_time_ms" and progress_cb is not None:
+                    try:
+                        progress_cb(int(line.split("=", 1)[1]) / 1_000_000.0)
+                    except ValueError:
+                        pass
+            else:
+                err_lines.append(line)
+
+    drainer = threading.Thread(target=_drain, daemon=True)
+    drainer.start()
     try:
-        subprocess.run(cmd, check=True, text=True, capture_output=True, timeout=900)
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"FFmpeg failed: {e.stderr or e}")
+        ret = proc.wait(timeout=900)
     except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
         raise RuntimeError("FFmpeg timeout (>15min)")
+    drainer.join(timeout=5)
+    if ret != 0:
+        raise RuntimeError(f"FFmpeg failed: {' '.join(err_lines) or ret}")
     if not out.exists():
         raise RuntimeError("FFmpeg did not create output")
     return out
 
+def hash_file_chunked(path: Path, chunk: int = 8 * 1024 * 1024) -> str:
+    """SHA256 pe citiri de 8MB — fara a incarca fisierul intreg in RAM."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(chunk)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
+
+def run_ffmpeg_pcm16k(src: Path, denoise: bool):
+    """
+    Decodeaza sursa direct in PCM 16kHz mono (numpy float32), prin pipe.
+    Fara WAV temporar pe disc si fara a doua decodare in faster-whisper,
+    care accepta array-uri numpy direct.
+    """
+    import numpy as np
+    af = "highpass=f=100,lowpass=f=6000,dynaudnorm=f=150:g=15" if denoise else "anull"
+    cmd = [
+        "ffmpeg", "-hide_banner", "-loglevel", "error",
+        "-i", str(src), "-ac", "1", "-ar", "16000",
+        "-af", af,
+        "-f", "s16le", "-acodec", "pcm_s16le", "pipe:1"
+    ]
+    try:
+        proc = subprocess.run(cmd, check=True, capture_output=True, timeout=900)
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode(errors="replace") if e.stderr else e
+        raise RuntimeError(f"FFmpeg failed: {stderr}")
+    except subprocess.TimeoutExpired:
+        raise RuntimeError("FFmpeg timeout (>15min)")
+    if not proc.stdout:
+        raise RuntimeError("FFmpeg produced no audio")
+    return np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+
 def export_srt(segments, path: Path):
     def ts(sec: float):
-        ms = int(round((sec - int(sec)) * 1000))
-        s = int(sec) % 60
-        m = (int(sec) // 60) % 60
-        h = int(sec) // 3600
+        whole = int(sec)
+        ms = int((sec - whole) * 1000 + 0.5)
+        h, rem = divmod(whole, 3600)
+        m, s = divmod(rem, 60)
         return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
-    with path.open("w", encoding="utf-8") as f:
-        idx = 1
-        for s in segments:
-            text = (s.get("text") or "").strip()
-            if not text:
-                continue
-            f.write(f"{idx}\n{ts(s.get('start',0.0))} --> {ts(s.get('end',0.0))}\n{text}\n\n")
-            idx += 1
+    # construim tot corpul SRT in memorie si scriem o singura data:
+    # un write() in loc de patru per segment
+    parts = []
+    idx = 1
+    for s in segments:
+        text = (s.get("text") or "").strip()
+        if not text:
+            continue
+        parts.append(f"{idx}\n{ts(s.get('start',0.0))} --> {ts(s.get('end',0.0))}\n{text}\n\n")
+        idx += 1
+    path.write_text("".join(parts), encoding="utf-8")
 
 # ==================== Engines ====================
 
@@ -160,9 +343,23 @@ class WhisperEngine:
     """
     _cache = {}
 
-    def __init__(self, model_name="small", compute_type="int8", log=None):
+    # compromis viteza/calitate, selectabil din UI: fast e ~4x mai rapid
+    # (greedy decoding), accurate reia decodarea la temperaturi crescatoare
+    QUALITY_PRESETS = {
+        "fast": dict(beam_size=1, best_of=1, temperature=0.0, patience=1.0,
+                     vad_parameters={"min_silence_duration_ms": 500}),
+        "balanced": dict(beam_size=5, best_of=5, temperature=0.0, patience=0.2),
+        "accurate": dict(beam_size=5, best_of=5, temperature=[0.0, 0.2, 0.4], patience=0.2),
+    }
+
+    def __init__(self, model_name="small", compute_type="auto", log=None):
         self.log = log or (lambda *_: None)
-        key = (model_name, compute_type)
+        self.quality = "balanced"
+        self.device = self._detect_device()
+        if compute_type == "auto":
+            # pe CUDA, int8_float16 foloseste tensor-core-urile; pe CPU int8 e optimul
+            compute_type = "int8_float16" if self.device == "cuda" else "int8"
+        key = (model_name, self.device, compute_type)
         if key in WhisperEngine._cache:
             self.model = WhisperEngine._cache[key]
             return
@@ -170,24 +367,43 @@ class WhisperEngine:
             from faster_whisper import WhisperModel
         except ImportError:
             raise RuntimeError("Missing 'faster-whisper'. Install: pip install faster-whisper")
-        self.log(f"[Whisper] Loading model: {model_name} ({compute_type}) ...")
+        self.log(f"[Whisper] Loading model: {model_name} ({compute_type}, {self.device}) ...")
         try:
-            self.model = WhisperModel(model_name, compute_type=compute_type)
+            self.model = WhisperModel(model_name, device=self.device,
+                                      compute_type=compute_type, num_workers=2)
         except Exception as e:
             raise RuntimeError(f"Whisper load error: {e}")
         WhisperEngine._cache[key] = self.model
         self.log("[Whisper] Ready.")
 
-    def transcribe(self, wav_path: Path):
+    @staticmethod
+    def _detect_device() -> str:
+        try:
+            import torch
+            if torch.cuda.is_available():
+                return "cuda"
+        except Exception:
+            pass
+        try:
+            import ctranslate2
+            if ctranslate2.get_cuda_device_count() > 0:
+                return "cuda"
+        except Exception:
+            pass
+        return "cpu"
+
+    def transcribe(self, audio):
+        """`audio` poate fi un Path catre WAV sau un numpy float32 mono la 16kHz."""
+        preset = self.QUALITY_PRESETS.get(self.quality, self.QUALITY_PRESETS["balanced"])
         try:
             segs, info = self.model.transcribe(
-                str(wav_path),
+                str(audio) if isinstance(audio, Path) else audio,
                 language=None,
                 vad_filter=True,
                 word_timestamps=False,
                 condition_on_previous_text=False,
-                beam_size=5, best_of=5, temperature=0.0, patience=0.2,
-                no_speech_threshold=0.45
+                no_speech_threshold=0.45,
+                **preset
             )
             segments = [{
                 "start": float(s.start or 0.0),
@@ -213,11 +429,10 @@ class GoogleEngine:
         self.max_retries = max_retries
         try:
             import speech_recognition as sr
-            from pydub import AudioSegment  # noqa
+            import soundfile  # noqa: F401
         except ImportError:
-            raise RuntimeError("Missing deps. Install: pip install SpeechRecognition pydub")
+            raise RuntimeError("Missing deps. Install: pip install SpeechRecognition soundfile")
         self.sr = sr
-        self.AudioSegment = AudioSegment
         self.log("[Google] FREE tier (rate limited)")
 
     def _chunk(self, audio_path: Path, start: float, end: float, attempt=1):
@@ -239,26 +454,37 @@ class GoogleEngine:
             raise RuntimeError(f"Google API failed: {e}")
 
     def transcribe(self, wav_path: Path):
-        audio = self.AudioSegment.from_wav(str(wav_path))
-        dur = len(audio) / 1000.0
-        chunk_ms = 20000 if dur < 60 else (25000 if dur < 300 else 30000)
+        # citire pe blocuri prin soundfile: in RAM sta un singur chunk, nu tot
+        # fisierul decodat (cum facea AudioSegment.from_wav)
+        import soundfile as sf
         segs, texts = [], []
-        total = (len(audio) + chunk_ms - 1) // chunk_ms
-        for i, off in enumerate(range(0, len(audio), chunk_ms), 1):
-            piece = audio[off:off+chunk_ms]
-            tmp = wav_path.with_suffix(f".chunk_{i:03d}.wav")
-            try:
-                piece.export(tmp, format="wav")
-                s = off/1000.0
-                e = (off+len(piece))/1000.0
-                self.log(f"  [Google] {i}/{total} {s:.0f}s-{e:.0f}s")
-                t, ok = self._chunk(tmp, s, e)
-                if t:
-                    segs.append({"start": s, "end": e, "text": t})
-                    texts.append(t)
-            finally:
-                try: tmp.unlink()
-                except Exception: pass
+        with sf.SoundFile(str(wav_path)) as f:
+            rate = f.samplerate
+            total_frames = len(f)
+            dur = total_frames / float(rate)
+            chunk_sec = 20 if dur < 60 else (25 if dur < 300 else 30)
+            chunk_frames = int(chunk_sec * rate)
+            total = (total_frames + chunk_frames - 1) // chunk_frames
+            i = 0
+            while True:
+                pos = f.tell()
+                block = f.read(chunk_frames, dtype='int16')
+                if len(block) == 0:
+                    break
+                i += 1
+                tmp = wav_path.with_suffix(f".chunk_{i:03d}.wav")
+                try:
+                    sf.write(str(tmp), block, rate, subtype='PCM_16')
+                    s = pos / float(rate)
+                    e = (pos + len(block)) / float(rate)
+                    self.log(f"  [Google] {i}/{total} {s:.0f}s-{e:.0f}s")
+                    t, ok = self._chunk(tmp, s, e)
+                    if t:
+                        segs.append({"start": s, "end": e, "text": t})
+                        texts.append(t)
+                finally:
+                    try: tmp.unlink()
+                    except Exception: pass
         full = " ".join(texts).strip()
         if not full:
             raise RuntimeError("No speech detected.")
@@ -279,8 +505,24 @@ class OpenAIEngine:
     MAX_REQUEST_BYTES = 20 * 1024 * 1024   # ~20MB per request (safe)
     DEFAULT_CHUNK_SEC = 600                # 10 minute per chunk
 
-    def __init__(self, model="gpt-4o-mini-transcribe", api_key=None, log=None):
+    # un client per cheie: refolosim pool-ul de conexiuni (TCP/TLS keep-alive)
+    # intre loturi si intre upload-urile concurente de chunk-uri
+    _client_cache: dict = {}
+
+    @classmethod
+    def client_for(cls, key: str):
+        from openai import OpenAI
+        h = hashlib.sha256(key.encode()).hexdigest()
+        client = cls._client_cache.get(h)
+        if client is None:
+            client = cls._client_cache.setdefault(h, OpenAI(api_key=key))
+        return client
+
+    def __init__(self, model="gpt-4o-mini-transcribe", api_key=None, log=None,
+                 cache_dir: Path|None = None):
         self.log = log or (lambda *_: None)
+        # cache adresat pe continut (SHA256 de chunk) — None il dezactiveaza
+        self.cache_dir = cache_dir
         try:
             from openai import OpenAI  # noqa: F401
         except Exception:
@@ -290,20 +532,52 @@ class OpenAIEngine:
         if not key:
             raise RuntimeError("OpenAI API key lipsa. Foloseste butonul «OpenAI Key…».")
 
-        from openai import OpenAI
-        self.client = OpenAI(api_key=key)
+        self.client = self.client_for(key)
         self.model = model
         self._verbose = self.model.startswith("whisper")
 
+    @staticmethod
+    def _shift(text, segments, start_offset: float):
+        # deplaseaza segmentele la timpul global (adaugam offset-ul chunk-ului)
+        for s in segments:
+            s["start"] += start_offset
+            s["end"] += start_offset
+        return text, segments
+
     def _call_api_once(self, wav_path: Path, start_offset: float = 0.0):
         """Trimite un singur chunk catre API si intoarce (text, segmente) relative la chunk."""
+        # lookup in cache: acelasi chunk (retry sau re-rulare peste acelasi lot)
+        # nu mai costa un al doilea apel API
+        cached_path = None
+        if self.cache_dir is not None:
+            try:
+                digest = hash_file_chunked(wav_path)
+                cached_path = self.cache_dir / f"{digest}.json"
+                if cached_path.exists():
+                    data = json.loads(cached_path.read_text(encoding="utf-8"))
+                    return self._shift(data["text"], data["segments"], start_offset)
+            except Exception:
+                cached_path = None
+
         fmt = "verbose_json" if self._verbose else "json"
-        with open(wav_path, "rb") as f:
-            resp = self.client.audio.transcriptions.create(
-                model=self.model,
-                file=f,
-                response_format=fmt,
-            )
+        # retry cu backoff exponential doar pe rate-limit; alte erori se propaga
+        delay = 2.0
+        for attempt in range(4):
+            try:
+                with open(wav_path, "rb") as f:
+                    resp = self.client.audio.transcriptions.create(
+                        model=self.model,
+                        file=f,
+                        response_format=fmt,
+                    )
+                break
+            except Exception as e:
+                msg = str(e).lower()
+                retryable = any(k in msg for k in ("rate limit", "429", "quota"))
+                if attempt == 3 or not retryable:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, 30.0)
 
         # extrage text + segmente relative la chunk
         if hasattr(resp, "text"):
@@ -330,12 +604,16 @@ class OpenAIEngine:
             dur = audio_duration_sec(wav_path)
             segments = [{"start": 0.0, "end": float(dur), "text": text}]
 
-        # deplaseaza segmentele la timpul global (adaugam offset)
-        for s in segments:
-            s["start"] += start_offset
-            s["end"] += start_offset
+        if cached_path is not None:
+            try:
+                cached_path.write_text(
+                    json.dumps({"text": text, "segments": segments}, ensure_ascii=False),
+                    encoding="utf-8"
+                )
+            except Exception:
+                pass
 
-        return text, segments
+        return self._shift(text, segments, start_offset)
 
     def transcribe(self, wav_path: Path):
         # calculeaza durata si bitrate pentru a decide chunking
@@ -360,21 +638,32 @@ class OpenAIEngine:
         self.log(f"[OpenAI] File prea mare – sparg in bucati de ~{per_chunk_sec//60} min...")
         parts = split_wav_to_chunks(wav_path, max_sec=per_chunk_sec, overlap_sec=0.0)
 
-        all_text = []
-        all_segments = []
-        for i, (chunk, s, e) in enumerate(parts, 1):
-            self.log(f"  [Chunk {i}/{len(parts)}] {s:.0f}s–{e:.0f}s ...")
-            try:
-                t, segs = self._call_api_once(chunk, start_offset=s)
-                if t:
-                    all_text.append(t)
-                all_segments.extend(segs)
-            finally:
+        # upload-urile sunt I/O-bound: le trimitem concurent si reordonam dupa
+        # timpul de start, ca textul final sa ramana in ordine cronologica
+        max_workers = max(1, min(len(parts), int(os.getenv("OPENAI_CONCURRENCY", "4"))))
+        results = []
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                futs = {
+                    ex.submit(self._call_api_once, chunk, s): (i, s, e)
+                    for i, (chunk, s, e) in enumerate(parts, 1)
+                }
+                for fut in as_completed(futs):
+                    i, s, e = futs[fut]
+                    t, segs = fut.result()
+                    self.log(f"  [Chunk {i}/{len(parts)}] {s:.0f}s–{e:.0f}s ok")
+                    results.append((s, t, segs))
+        finally:
+            for chunk, _, _ in parts:
                 try:
                     chunk.unlink(missing_ok=True)
                 except Exception:
                     pass
 
+        results.sort(key=lambda r: r[0])
+        all_text = [t for _, t, _ in results if t]
+        all_segments = [seg for _, _, segs in results for seg in segs]
+
         meta = {"language": "auto", "language_probability": 1.0 if all_text else 0.0, "duration_sec": dur}
         return " ".join(all_text).strip(), all_segments, meta
 
@@ -394,14 +683,22 @@ class TranscribersApp(tk.Tk):
 
         self.engine_var = tk.StringVar(value="whisper")
         self.model_var = tk.StringVar(value=os.getenv("WHISPER_MODEL", "small"))
-        self.compute_var = tk.StringVar(value=os.getenv("COMPUTE_TYPE", "int8"))
+        self.compute_var = tk.StringVar(value=os.getenv("COMPUTE_TYPE", "auto"))
         self.denoise_var = tk.BooleanVar(value=True)
+        self.quality_var = tk.StringVar(value="balanced")
         self.export_srt_var = tk.BooleanVar(value=True)
+        self.cache_api_var = tk.BooleanVar(value=True)
         self.keep_last_var = tk.IntVar(value=3)
+        self.workers_var = tk.IntVar(value=2)
         self.output_dir = tk.StringVar(value=str((Path.cwd() / "Received" / "transcripts").resolve()))
 
+        # log-ul e alimentat din thread-urile worker printr-o coada; doar
+        # thread-ul Tk atinge widget-ul, in loturi, la fiecare 50ms
+        self._log_q: queue.Queue = queue.Queue()
+
         self._build_interface()
         self._check_base_deps()
+        self.after(50, self._flush_log)
 
     # ---------- UI ----------
 
@@ -429,6 +726,12 @@ class TranscribersApp(tk.Tk):
                                         values=["tiny","base","small","medium","large-v2","large-v3"], width=16)
         self.model_combo.pack(side="left")
 
+        tk.Label(header, text="Compute:", bg="#10131a", fg="#E0E6ED").pack(side="left", padx=(12,4))
+        self.compute_combo = ttk.Combobox(header, textvariable=self.compute_var, state="readonly",
+                                          values=["auto","int8","int8_float16","float16","float32"],
+                                          width=12)
+        self.compute_combo.pack(side="left")
+
         tk.Button(header, text="OpenAI Key...", command=self._open_openai_key_dialog,
                   bg="#243145", fg="white").pack(side="left", padx=6)
 
@@ -437,13 +740,23 @@ class TranscribersApp(tk.Tk):
 
         tk.Checkbutton(options, text="Denoise Audio", variable=self.denoise_var,
                        bg="#10131a", fg="#E0E6ED", selectcolor="#1a2233").pack(side="left")
+
+        tk.Label(options, text="Quality:", bg="#10131a", fg="#E0E6ED").pack(side="left", padx=(16,4))
+        ttk.Combobox(options, textvariable=self.quality_var, state="readonly",
+                     values=["fast", "balanced", "accurate"], width=9).pack(side="left")
         tk.Checkbutton(options, text="Export SRT Subtitles", variable=self.export_srt_var,
                        bg="#10131a", fg="#E0E6ED", selectcolor="#1a2233").pack(side="left", padx=(16,0))
+        tk.Checkbutton(options, text="Cache API results", variable=self.cache_api_var,
+                       bg="#10131a", fg="#E0E6ED", selectcolor="#1a2233").pack(side="left", padx=(16,0))
 
         tk.Label(options, text="Keep last:", bg="#10131a", fg="#E0E6ED").pack(side="left", padx=(16,4))
         tk.Entry(options, textvariable=self.keep_last_var, width=4,
                  bg="#182033", fg="white", insertbackground="white").pack(side="left")
 
+        tk.Label(options, text="Workers:", bg="#10131a", fg="#E0E6ED").pack(side="left", padx=(16,4))
+        tk.Spinbox(options, from_=1, to=8, textvariable=self.workers_var, width=3,
+                   bg="#182033", fg="white", insertbackground="white").pack(side="left")
+
         tk.Label(options, text="Output:", bg="#10131a", fg="#E0E6ED").pack(side="left", padx=(16,4))
         tk.Entry(options, textvariable=self.output_dir, width=42,
                  bg="#182033", fg="white", insertbackground="white").pack(side="left", padx=(0,4))
@@ -477,9 +790,19 @@ class TranscribersApp(tk.Tk):
                   bg="#FF4444", fg="white", width=12).pack(side="left", padx=4)
 
     def _log(self, *msgs):
-        self.log_box.insert(tk.END, " ".join(str(m) for m in msgs) + "\n")
-        self.log_box.see(tk.END)
-        self.update_idletasks()
+        self._log_q.put(" ".join(str(m) for m in msgs))
+
+    def _flush_log(self):
+        msgs = []
+        try:
+            while len(msgs) < 200:
+                msgs.append(self._log_q.get_nowait())
+        except queue.Empty:
+            pass
+        if msgs:
+            self.log_box.insert(tk.END, "\n".join(msgs) + "\n")
+            self.log_box.see(tk.END)
+        self.after(50, self._flush_log)
 
     # ---------- deps / engine change ----------
 
@@ -503,10 +826,12 @@ class TranscribersApp(tk.Tk):
             if self.model_var.get() not in self.model_combo["values"]:
                 self.model_var.set("small")
             self.model_combo["state"] = "readonly"
+            self.compute_combo["state"] = "readonly"
         elif eng == "google":
             self.model_combo["values"] = ["(n/a)"]
             self.model_var.set("(n/a)")
             self.model_combo["state"] = "disabled"
+            self.compute_combo["state"] = "disabled"
             messagebox.showinfo("Google Web Speech",
                                 "Free demo API, limita ~50 requests/zi. Pentru proiect foloseste Whisper/OpenAI.")
         else:  # openai
@@ -514,6 +839,7 @@ class TranscribersApp(tk.Tk):
             if self.model_var.get() not in self.model_combo["values"]:
                 self.model_var.set("gpt-4o-mini-transcribe")
             self.model_combo["state"] = "readonly"
+            self.compute_combo["state"] = "disabled"
 
     # ---------- file ops ----------
 
@@ -572,8 +898,7 @@ class TranscribersApp(tk.Tk):
             if not key:
                 messagebox.showwarning("Warning", "Key is empty."); return
             try:
-                from openai import OpenAI
-                client = OpenAI(api_key=key)
+                client = OpenAIEngine.client_for(key)
                 _ = client.models.list()
                 messagebox.showinfo("OK", "Key valid (auth OK).")
             except Exception as e:
@@ -615,71 +940,196 @@ class TranscribersApp(tk.Tk):
         ensure_dir(dst.parent)
         return dst
 
+    def _process_one(self, idx: int, total: int, src: Path, base: Path|None, engine, wav=None):
+        """Preproceseaza (daca nu s-a facut deja) si transcrie un fisier.
+
+        Intoarce (ok, durata_sec). `wav` poate veni gata preprocesat de la
+        producatorul pipeline-ului, caz in care ffmpeg nu mai ruleaza aici.
+        """
+        try:
+            if wav is None:
+                self._log(f"\n[{idx}/{total}] Processing:", src.name)
+                self._log("├─ Audio preprocessing ...")
+                wav = self._preprocess(src, engine)
+
+            self._log(f"├─ Transcribing [{self.engine_var.get().upper()}] ...")
+            full, segments, meta = engine.transcribe(wav)
+            dur = float(meta.get("duration_sec", 0.0))
+
+            payload = {
+                "version": "1.0",
+                "timestamp": now_iso(),
+                "source_file": src.name,
+                "duration_sec": dur,
+                "language": meta.get("language", "auto"),
+                "language_confidence": float(meta.get("language_probability", 0.0)),
+                "text": full,
+                "segments": segments,
+                "metadata": {
+                    "engine": self.engine_var.get(),
+                    "model": self.model_var.get(),
+                    "denoise": bool(self.denoise_var.get()),
+                    "processed_at": datetime.now().isoformat()
+                }
+            }
+
+            json_path = self._get_output_path(src, base, ".json")
+            if orjson is not None:
+                json_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+            else:
+                json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2),
+                                     encoding="utf-8")
+            self._log("├─ Saved:", json_path.name)
+
+            if self.export_srt_var.get():
+                srt_path = self._get_output_path(src, base, ".srt")
+                export_srt(segments, srt_path)
+                self._log("└─ SRT export:", srt_path.name)
+
+            self._log("✓ DONE")
+            return True, dur
+        except Exception as e:
+            self._log("✗ ERROR:", e)
+            return False, 0.0
+        finally:
+            # nu stergem decat temporare — sursa poate fi intoarsa ca atare
+            if isinstance(wav, Path) and wav != src and wav.exists():
+                try: wav.unlink()
+                except Exception: pass
+
+    def _preprocess(self, src: Path, engine):
+        """ffmpeg: PCM direct in memorie pentru Whisper, WAV temporar pentru restul."""
+        denoise = bool(self.denoise_var.get())
+        if isinstance(engine, WhisperEngine):
+            return run_ffmpeg_pcm16k(src, denoise)
+        return run_ffmpeg_wav16k(src, denoise, progress_cb=self._ffmpeg_progress(src))
+
+    def _ffmpeg_progress(self, src: Path):
+        """Raporteaza progresul ffmpeg in log, cel mult o data la 5 secunde."""
+        last = [0.0]
+
+        def cb(sec: float):
+            now = time.monotonic()
+            if now - last[0] >= 5.0:
+                last[0] = now
+                self._log(f"│   [ffmpeg] {src.name}: {sec:.0f}s processed")
+        return cb
+
     def _worker_process(self):
         # pick engine
         try:
             if self.engine_var.get() == "whisper":
                 engine = WhisperEngine(self.model_var.get(), self.compute_var.get(), log=self._log)
+                engine.quality = self.quality_var.get()
             elif self.engine_var.get() == "google":
                 engine = GoogleEngine(log=self._log)
             else:
-                engine = OpenAIEngine(model=self.model_var.get(), api_key=self.openai_key, log=self._log)
+                cache_dir = None
+                if self.cache_api_var.get():
+                    cache_dir = ensure_dir(Path(self.output_dir.get()) / ".api_cache")
+                engine = OpenAIEngine(model=self.model_var.get(), api_key=self.openai_key,
+                                      log=self._log, cache_dir=cache_dir)
         except Exception as e:
             self._log("[ERROR] Engine init:", e); return
 
         ok, err = 0, 0
         total_audio = 0.0
         t0 = time.time()
-
-        for idx, (src, base) in enumerate(self.audio_files, 1):
-            if self.stop_processing: break
-            wav = None
-            try:
-                self._log(f"\n[{idx}/{len(self.audio_files)}] Processing:", src.name)
-                self._log("├─ Audio preprocessing ...")
-                wav = run_ffmpeg_wav16k(src, denoise=bool(self.denoise_var.get()))
-
-                self._log(f"├─ Transcribing [{self.engine_var.get().upper()}] ...")
-                full, segments, meta = engine.transcribe(wav)
-                dur = float(meta.get("duration_sec", 0.0))
-                total_audio += dur
-
-                payload = {
-                    "version": "1.0",
-                    "timestamp": now_iso(),
-                    "source_file": src.name,
-                    "duration_sec": dur,
-                    "language": meta.get("language", "auto"),
-                    "language_confidence": float(meta.get("language_probability", 0.0)),
-                    "text": full,
-                    "segments": segments,
-                    "metadata": {
-                        "engine": self.engine_var.get(),
-                        "model": self.model_var.get(),
-                        "denoise": bool(self.denoise_var.get()),
-                        "processed_at": datetime.now().isoformat()
-                    }
+        total = len(self.audio_files)
+
+        workers = max(1, int(self.workers_var.get()))
+        # pe GPU, transcrierile concurente se bat pe VRAM — ramanem la un worker
+        if isinstance(engine, WhisperEngine) and getattr(engine, "device", "cpu") != "cpu":
+            workers = 1
+
+        if workers > 1 and total > 1:
+            # fisierele sunt independente: ffmpeg-ul fisierului N+1 se suprapune
+            # cu transcrierea fisierului N
+            done = 0
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futs = {
+                    pool.submit(self._process_one, idx, total, src, base, engine): idx
+                    for idx, (src, base) in enumerate(self.audio_files, 1)
                 }
-
-                json_path = self._get_output_path(src, base, ".json")
-                json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-                self._log("├─ Saved:", json_path.name)
-
-                if self.export_srt_var.get():
-                    srt_path = self._get_output_path(src, base, ".srt")
-                    export_srt(segments, srt_path)
-                    self._log("└─ SRT export:", srt_path.name)
-
-                ok += 1
-                self._log("✓ DONE")
-            except Exception as e:
-                err += 1
-                self._log("✗ ERROR:", e)
-            finally:
-                if wav and wav.exists():
-                    try: wav.unlink()
-                    except Exception: pass
-                self.progress["value"] = idx
+                for fut in as_completed(futs):
+                    if self.stop_processing:
+                        for pending in futs:
+                            pending.cancel()
+                    if fut.cancelled():
+                        continue
+                    success, dur = fut.result()
+                    if success:
+                        ok += 1
+                    else:
+                        err += 1
+                    total_audio += dur
+                    done += 1
+                    self.progress["value"] = done
+                    self.update_idletasks()
+        else:
+            # pipeline producator/consumator: ffmpeg pregateste fisierul N+1 cat
+            # timp fisierul N se transcrie; coada de 2 tine un fisier "gata" in
+            # asteptare fara sa acumuleze WAV-uri temporare pe disc
+            work_q: queue.Queue = queue.Queue(maxsize=2)
+
+            def _producer():
+                # ffmpeg e independent per fisier si ruleaza in subprocese (fara
+                # GIL), deci preprocesam cateva fisiere in paralel; fereastra de
+                # in-flight limitata tine prefetch-ul marginit, iar rezultatele
+                # intra in coada in ordinea de la intrare.
+                # Pentru Whisper insa _preprocess intoarce PCM-ul decodat in RAM
+                # (~230 MB per ora de audio la 16kHz float32), asa ca fereastra
+                # ramane 1 — coada ofera deja un fisier de lookahead
+                if isinstance(engine, WhisperEngine):
+                    n_pre = 1
+                else:
+                    n_pre = min(4, os.cpu_count() or 2)
+                source_iter = iter(enumerate(self.audio_files, 1))
+                inflight = []
+                with ThreadPoolExecutor(max_workers=n_pre) as pre:
+                    while True:
+                        while len(inflight) < n_pre and not self.stop_processing:
+                            nxt = next(source_iter, None)
+                            if nxt is None:
+                                break
+                            idx, (src, base) = nxt
+                            self._log(f"\n[{idx}/{total}] Processing:", src.name)
+                            self._log("├─ Audio preprocessing ...")
+                            inflight.append((idx, src, base, pre.submit(self._preprocess, src, engine)))
+                        if not inflight:
+                            break
+                        idx, src, base, fut = inflight.pop(0)
+                        try:
+                            work_q.put((idx, src, base, fut.result(), None))
+                        except Exception as e:
+                            work_q.put((idx, src, base, None, e))
+                work_q.put(None)
+
+            threading.Thread(target=_producer, daemon=True).start()
+            done = 0
+            while True:
+                item = work_q.get()
+                if item is None:
+                    break
+                idx, src, base, wav, exc = item
+                if self.stop_processing:
+                    # drenam coada pana la sentinel, curatand WAV-urile produse
+                    if isinstance(wav, Path) and wav != src and wav.exists():
+                        try: wav.unlink()
+                        except Exception: pass
+                    continue
+                if exc is not None:
+                    err += 1
+                    self._log("✗ ERROR:", exc)
+                else:
+                    success, dur = self._process_one(idx, total, src, base, engine, wav=wav)
+                    if success:
+                        ok += 1
+                    else:
+                        err += 1
+                    total_audio += dur
+                done += 1
+                self.progress["value"] = done
                 self.update_idletasks()
 
         # cleanup
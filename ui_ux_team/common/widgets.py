@@ -0,0 +1,73 @@
+"""Widgets shared by the UI prototypes.
+
+Both prototypes carried their own copy of the click-to-seek slider and the
+flat icon-button setup; the copies had already started to drift. This module
+is the single maintained version.
+"""
+from pathlib import Path
+
+from PySide6.QtWidgets import QSlider
+from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, QSize
+
+# Bundled asset -> freedesktop icon-theme name. Theme icons come pre-rendered
+# at the common sizes, so using them skips our own decode + scale entirely.
+_THEME_NAMES = {
+    "play.png": "media-playback-start",
+    "pause.png": "media-playback-pause",
+    "next.png": "media-skip-forward",
+    "prev.png": "media-skip-backward",
+    "previous.png": "media-skip-backward",
+    "minimize.png": "window-minimize",
+    "close.png": "window-close",
+}
+
+
+def themed_icon(path):
+    """QIcon for *path*, preferring the platform icon theme when it has a
+    matching entry and falling back to the bundled PNG otherwise."""
+    name = _THEME_NAMES.get(Path(path).name)
+    if name:
+        icon = QIcon.fromTheme(name)
+        if not icon.isNull():
+            return icon
+    return QIcon(str(path))
+
+
+class SmoothSlider(QSlider):
+    """QSlider that jumps straight to the clicked position."""
+
+    def __init__(self, orientation=Qt.Horizontal, *args, **kwargs):
+        super().__init__(orientation, *args, **kwargs)
+        self.setCursor(Qt.PointingHandCursor)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            if self.orientation() == Qt.Horizontal:
+                # integer pos() is enough for a pixel -> value mapping
+                x = event.pos().x()
+                vmin, vmax = self.minimum(), self.maximum()
+                w = max(1, self.width() - 1)
+                value = vmin + round((x / w) * (vmax - vmin))
+            else:
+                y = event.pos().y()
+                vmin, vmax = self.minimum(), self.maximum()
+                h = max(1, self.height() - 1)
+                value = vmax - round((y / h) * (vmax - vmin))
+            self.setValue(value)
+            event.accept()
+        super().mousePressEvent(event)
+
+
+def load_icon_button(button, path, size):
+    """Configure *button* as a flat icon button.
+
+    QIcon decodes lazily and caches its own scaled renders, so there is no
+    manual decode -> scale -> wrap pipeline to repeat per button.
+    """
+    button.setIcon(themed_icon(path))
+    button.setIconSize(QSize(size, size))
+    button.setFixedSize(size + 10, size + 10)
+    button.setFlat(True)
+    button.setStyleSheet("border: none;")
+    return button
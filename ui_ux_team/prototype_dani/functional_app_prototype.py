@@ -1,39 +1,177 @@
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QPushButton, QLabel, QHBoxLayout, 
-    QVBoxLayout, QSlider, QGraphicsDropShadowEffect, QGraphicsOpacityEffect,
-    QFrame
+    QApplication, QWidget, QPushButton, QLabel, QHBoxLayout,
+    QVBoxLayout, QGraphicsDropShadowEffect, QGraphicsOpacityEffect,
+    QFrame, QGraphicsScene, QGraphicsPixmapItem
 )
-from PySide6.QtGui import QPixmap, QIcon, QColor
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QSize
+from PySide6.QtGui import QPixmap, QPixmapCache, QIcon, QColor, QPainter
+from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QVariantAnimation, QEasingCurve, QSize, QRectF, QSignalBlocker
 import sys
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.widgets import SmoothSlider
+
 # === CONSTANTS ===
 BASE_DIR = Path(__file__).resolve().parent
 ASSETS_DIR = BASE_DIR / "assets"
 
-# === Smooth Clickable Slider ===
-class SmoothSlider(QSlider):
-    def __init__(self, orientation=Qt.Horizontal, *args, **kwargs):
-        super().__init__(orientation, *args, **kwargs)
-        self.setCursor(Qt.PointingHandCursor)
-        self.setMouseTracking(True)
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            if self.orientation() == Qt.Horizontal:
-                x = event.position().x()
-                vmin, vmax = self.minimum(), self.maximum()
-                w = max(1, self.width() - 1)
-                value = vmin + round((x / w) * (vmax - vmin))
-            else:
-                y = event.position().y()
-                vmin, vmax = self.minimum(), self.maximum()
-                h = max(1, self.height() - 1)
-                value = vmax - round((y / h) * (vmax - vmin))
-            self.setValue(value)
-            event.accept()
-        super().mousePressEvent(event)
+# Every m:ss string up to an hour, built once; format_time is a list index
+_TIME_STRINGS = [f"{s // 60}:{s % 60:02d}" for s in range(3600)]
+
+# Shared colors/sizes built once instead of per widget or per event
+_GLOW_CYAN = QColor(0, 200, 255, 180)
+_GLOW_PINK = QColor(255, 0, 128)
+_GLOW_TEAL = QColor(0, 255, 255, 150)
+_GLOW_TEAL_BRIGHT = QColor(0, 255, 255, 180)
+_GLOW_TEAL_DIM = QColor(0, 255, 255, 120)
+_SIZE_40 = QSize(40, 40)
+_SIZE_50 = QSize(50, 50)
+
+# One application-level stylesheet, parsed once. Widgets opt in through
+# objectName / dynamic-property selectors instead of per-widget setStyleSheet
+# calls, each of which triggers its own parse + repolish.
+APP_STYLESHEET = """
+QWidget#mainWindow {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #0a0e17, stop:1 #1a2235);
+    color: white;
+}
+QPushButton[flatIcon="true"] {
+    border: none;
+    background: transparent;
+}
+QLabel#titleLabel {
+    font-size: 32px;
+    font-weight: bold;
+    color: #00ffff;
+}
+QLabel#timeLabel {
+    color: #00ffff;
+    font-size: 18px;
+    font-weight: bold;
+}
+QLabel#tabSeparator {
+    color: #444;
+    font-size: 16px;
+}
+TabButton {
+    color: #6B7B9F;
+    font-size: 16px;
+    border: none;
+    padding: 8px 20px;
+    background: transparent;
+}
+TabButton:hover {
+    color: #00ffff;
+}
+TabButton[active="true"] {
+    color: #00ffff;
+    font-weight: bold;
+    border-bottom: 3px solid #00ffff;
+}
+QSlider#volumeSlider::groove:vertical {
+    background: transparent;
+    width: 8px;
+}
+QSlider#volumeSlider::sub-page:vertical {
+    background: transparent;
+}
+QSlider#volumeSlider::handle:vertical {
+    background: rgba(0, 255, 255, 200);
+    border: 2px solid #00ffff;
+    height: 16px;
+    width: 16px;
+    border-radius: 8px;
+    margin: 0 -4px;
+}
+QSlider#progressSlider::groove:horizontal {
+    background: #23345b;
+    height: 8px;
+    border-radius: 4px;
+}
+QSlider#progressSlider::sub-page:horizontal {
+    background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+        stop:0 #00ffff, stop:1 #ff00ff);
+    border-radius: 4px;
+}
+QSlider#progressSlider::handle:horizontal {
+    background: #00ffff;
+    border: 3px solid #0a0e17;
+    width: 18px;
+    height: 18px;
+    border-radius: 9px;
+    margin: -5px 0;
+}
+"""
+
+
+# Full-resolution originals, decoded once by preload_assets() before any
+# widget is built; load_scaled() scales from these instead of re-reading disk
+_PRELOADED = {}
+
+# Paths already reported as unloadable, so a bad asset warns exactly once
+_WARNED_PATHS = set()
+
+
+def preload_assets():
+    """Decode every PNG in ASSETS_DIR up front, in one pass."""
+    for png in sorted(ASSETS_DIR.glob("*.png")):
+        pix = QPixmap(str(png))
+        if not pix.isNull():
+            _PRELOADED[str(png)] = pix
+
+
+def load_scaled(path, w, h, mode=Qt.SmoothTransformation, keep_aspect=True):
+    """Load + scale a pixmap through QPixmapCache so each (path, size) pair
+    is decoded and scaled only once per process.
+
+    Small icons pass Qt.FastTransformation: at <= 65px the quality
+    difference is invisible and the scale is an order of magnitude cheaper.
+    """
+    key = f"{path}|{w}x{h}"
+    pix = QPixmapCache.find(key)
+    if pix is None:
+        pix = _PRELOADED.get(str(path))
+        if pix is None:
+            pix = QPixmap(str(path))
+        if pix.isNull():
+            # QPixmap reports failure through isNull(), it never raises
+            if str(path) not in _WARNED_PATHS:
+                _WARNED_PATHS.add(str(path))
+                print(f"Warning: could not load image: {path}")
+        elif w == h:
+            # square targets (all the icons): skip the aspect-fit math
+            pix = pix.scaledToWidth(w, mode)
+        else:
+            aspect = Qt.KeepAspectRatio if keep_aspect else Qt.IgnoreAspectRatio
+            pix = pix.scaled(w, h, aspect, mode)
+        QPixmapCache.insert(key, pix)
+    return pix
+
+
+def bake_glow(pixmap, color, blur_radius, padding=10):
+    """Render *pixmap* with a drop-shadow glow into a new pixmap, once.
+
+    A live QGraphicsDropShadowEffect re-rasterizes and re-blurs the widget on
+    every repaint; baking pays that cost a single time up front and hover/like
+    state changes become plain pixmap swaps.
+    """
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(pixmap)
+    effect = QGraphicsDropShadowEffect()
+    effect.setBlurRadius(blur_radius)
+    effect.setColor(color)
+    effect.setOffset(0, 0)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+
+    baked = QPixmap(pixmap.width() + 2 * padding, pixmap.height() + 2 * padding)
+    baked.fill(Qt.transparent)
+    painter = QPainter(baked)
+    scene.render(painter, QRectF(baked.rect()),
+                 QRectF(-padding, -padding, baked.width(), baked.height()))
+    painter.end()
+    return baked
 
 # === Hover Button ===
 class HoverButton(QPushButton):
@@ -42,39 +180,38 @@ class HoverButton(QPushButton):
         self.icon_path = icon_path
         self.btn_size = size
         self.is_hovered = False
-        
+        self._icon_normal = None
+        self._icon_glow = None
+
         self.setup_button()
-        
+
     def setup_button(self):
-        try:
-            pix = QPixmap(str(self.icon_path))
-            if not pix.isNull():
-                pix = pix.scaled(self.btn_size, self.btn_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.setIcon(QIcon(pix))
-                self.setIconSize(QSize(self.btn_size, self.btn_size))
-        except Exception as e:
-            print(f"Error loading icon {self.icon_path}: {e}")
-            
+        pix = load_scaled(self.icon_path, self.btn_size, self.btn_size, Qt.FastTransformation)
+        if not pix.isNull():
+            self._icon_normal = QIcon(pix)
+            # Glow baked once; hovering becomes an icon swap instead of a
+            # live blur effect re-running on every repaint
+            self._icon_glow = QIcon(bake_glow(pix, _GLOW_CYAN, 20))
+            self.setIcon(self._icon_normal)
+            self.setIconSize(QSize(self.btn_size, self.btn_size))
+
         self.setFixedSize(self.btn_size + 20, self.btn_size + 20)
         self.setFlat(True)
-        self.setStyleSheet("border: none; background: transparent;")
+        self.setProperty("flatIcon", True)
         self.setCursor(Qt.PointingHandCursor)
-        
-        # Glow effect
-        self.glow = QGraphicsDropShadowEffect()
-        self.glow.setBlurRadius(0)
-        self.glow.setColor(QColor(0, 200, 255, 180))
-        self.glow.setOffset(0, 0)
-        self.setGraphicsEffect(self.glow)
-        
+
     def enterEvent(self, event):
         self.is_hovered = True
-        self.glow.setBlurRadius(20)
+        if self._icon_glow is not None:
+            self.setIcon(self._icon_glow)
+            self.setIconSize(QSize(self.btn_size + 20, self.btn_size + 20))
         super().enterEvent(event)
-        
+
     def leaveEvent(self, event):
         self.is_hovered = False
-        self.glow.setBlurRadius(0)
+        if self._icon_normal is not None:
+            self.setIcon(self._icon_normal)
+            self.setIconSize(QSize(self.btn_size, self.btn_size))
         super().leaveEvent(event)
 
 # === Animated Heart Button ===
@@ -83,44 +220,44 @@ class HeartButton(QPushButton):
         super().__init__(parent)
         self.icon_path = icon_path
         self.is_liked = False
-        
-        try:
-            pix = QPixmap(str(icon_path))
-            if not pix.isNull():
-                pix = pix.scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.setIcon(QIcon(pix))
-                self.setIconSize(QSize(40, 40))
-        except Exception as e:
-            print(f"Error loading heart icon: {e}")
-            
+        self._icon_normal = None
+        self._icon_liked = None
+
+        pix = load_scaled(icon_path, 40, 40, Qt.FastTransformation)
+        if not pix.isNull():
+            self._icon_normal = QIcon(pix)
+            # Pink glow baked once; liking swaps icons, no live blur
+            self._icon_liked = QIcon(bake_glow(pix, _GLOW_PINK, 25, padding=5))
+            self.setIcon(self._icon_normal)
+            self.setIconSize(_SIZE_40)
+
         self.setFixedSize(60, 60)
         self.setFlat(True)
-        self.setStyleSheet("border: none; background: transparent;")
+        self.setProperty("flatIcon", True)
         self.setCursor(Qt.PointingHandCursor)
-        
-        self.glow = QGraphicsDropShadowEffect()
-        self.glow.setBlurRadius(0)
-        self.glow.setColor(QColor(255, 0, 128))
-        self.glow.setOffset(0, 0)
-        self.setGraphicsEffect(self.glow)
-        
-        # Scale animation
-        self.scale_anim = QPropertyAnimation(self, b"iconSize")
-        self.scale_anim.setDuration(200)
-        self.scale_anim.setEasingCurve(QEasingCurve.OutBack)
-        
+
+        # Scale animation, built lazily on the first like
+        self.scale_anim = None
+
     def toggle_like(self):
         self.is_liked = not self.is_liked
-        
+
+        if self.scale_anim is None:
+            self.scale_anim = QPropertyAnimation(self, b"iconSize")
+            self.scale_anim.setDuration(200)
+            self.scale_anim.setEasingCurve(QEasingCurve.OutBack)
+
         if self.is_liked:
-            self.glow.setBlurRadius(25)
-            self.scale_anim.setStartValue(QSize(40, 40))
-            self.scale_anim.setEndValue(QSize(50, 50))
+            if self._icon_liked is not None:
+                self.setIcon(self._icon_liked)
+            self.scale_anim.setStartValue(_SIZE_40)
+            self.scale_anim.setEndValue(_SIZE_50)
             self.scale_anim.start()
         else:
-            self.glow.setBlurRadius(0)
-            self.scale_anim.setStartValue(QSize(50, 50))
-            self.scale_anim.setEndValue(QSize(40, 40))
+            if self._icon_normal is not None:
+                self.setIcon(self._icon_normal)
+            self.scale_anim.setStartValue(_SIZE_50)
+            self.scale_anim.setEndValue(_SIZE_40)
             self.scale_anim.start()
 
 # === Album Art with Glow ===
@@ -130,37 +267,52 @@ class AlbumArtWidget(QLabel):
         self.setFixedSize(300, 300)
         self.setAlignment(Qt.AlignCenter)
         
-        try:
-            pix = QPixmap(str(image_path))
-            if not pix.isNull():
-                pix = pix.scaled(280, 280, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.setPixmap(pix)
-        except Exception as e:
-            print(f"Error loading album art: {e}")
+        self._glow_min = None
+        self._glow_max = None
+
+        pix = load_scaled(image_path, 280, 280)
+        if not pix.isNull():
+            # Both ends of the pulse rendered once; the animation only
+            # blends them instead of re-blurring the widget every frame
+            self._glow_min = bake_glow(pix, _GLOW_TEAL, 20)
+            self._glow_max = bake_glow(pix, _GLOW_TEAL, 40)
+            self.setPixmap(self._glow_min)
+        else:
             self.setText("♪")
             self.setStyleSheet("font-size: 100px; color: #00ffff;")
-        
-        # Pulsing glow
-        self.glow = QGraphicsDropShadowEffect()
-        self.glow.setBlurRadius(20)
-        self.glow.setColor(QColor(0, 255, 255, 150))
-        self.glow.setOffset(0, 0)
-        self.setGraphicsEffect(self.glow)
-        
-        # Animation
-        self.anim = QPropertyAnimation(self.glow, b"blurRadius")
-        self.anim.setDuration(2000)
-        self.anim.setStartValue(20)
-        self.anim.setEndValue(40)
-        self.anim.setEasingCurve(QEasingCurve.InOutSine)
-        self.anim.setLoopCount(-1)
-        
+
+        # Pulse animation, built lazily the first time playback starts
+        self.anim = None
+
+    def _blend_glow(self, t):
+        frame = QPixmap(self._glow_min.size())
+        frame.fill(Qt.transparent)
+        painter = QPainter(frame)
+        painter.drawPixmap(0, 0, self._glow_min)
+        painter.setOpacity(t)
+        painter.drawPixmap(0, 0, self._glow_max)
+        painter.end()
+        self.setPixmap(frame)
+
     def start_glow(self):
+        if self._glow_min is None:
+            return
+        if self.anim is None:
+            # Blends glow_min -> glow_max with an opacity blit per frame
+            self.anim = QVariantAnimation(self)
+            self.anim.setDuration(2000)
+            self.anim.setStartValue(0.0)
+            self.anim.setEndValue(1.0)
+            self.anim.setEasingCurve(QEasingCurve.InOutSine)
+            self.anim.setLoopCount(-1)
+            self.anim.valueChanged.connect(self._blend_glow)
         self.anim.start()
-        
+
     def stop_glow(self):
-        self.anim.stop()
-        self.glow.setBlurRadius(20)
+        if self.anim is not None:
+            self.anim.stop()
+        if self._glow_min is not None:
+            self.setPixmap(self._glow_min)
 
 # === Volume Control ===
 class VolumeControl(QWidget):
@@ -181,38 +333,28 @@ class VolumeControl(QWidget):
         
         # Volume bar image
         self.volume_bg = QLabel()
-        try:
-            volume_pix = QPixmap(str(ASSETS_DIR / "volumebar.png"))
-            if not volume_pix.isNull():
-                self.volume_bg.setPixmap(volume_pix.scaled(40, 220, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        except Exception as e:
-            print(f"Error loading volume bar: {e}")
-            
+        self._bg_normal = None
+        self._bg_glow = None
+        # Deliberately stretched to fill the whole 40x220 slot (the source
+        # art is much larger and not this aspect); fast filtering is fine
+        # for a mostly-flat gradient bar
+        volume_pix = load_scaled(ASSETS_DIR / "volumebar.png", 40, 220,
+                                 Qt.FastTransformation, keep_aspect=False)
+        if not volume_pix.isNull():
+            self._bg_normal = volume_pix
+            # Glow baked once; hover swaps pixmaps instead of blurring live
+            self._bg_glow = bake_glow(volume_pix, _GLOW_TEAL_BRIGHT, 20, padding=5)
+            self.volume_bg.setPixmap(self._bg_normal)
+
         self.volume_bg.setAlignment(Qt.AlignCenter)
         container_layout.addWidget(self.volume_bg)
         
         # Functional slider
         self.slider = SmoothSlider(Qt.Vertical)
+        self.slider.setObjectName("volumeSlider")
         self.slider.setRange(0, 100)
         self.slider.setValue(70)
         self.slider.setFixedSize(40, 220)
-        self.slider.setStyleSheet("""
-            QSlider::groove:vertical {
-                background: transparent;
-                width: 8px;
-            }
-            QSlider::sub-page:vertical {
-                background: transparent;
-            }
-            QSlider::handle:vertical {
-                background: rgba(0, 255, 255, 200);
-                border: 2px solid #00ffff;
-                height: 16px;
-                width: 16px;
-                border-radius: 8px;
-                margin: 0 -4px;
-            }
-        """)
         self.slider.setParent(container)
         self.slider.move(5, 15)
         
@@ -222,22 +364,17 @@ class VolumeControl(QWidget):
         self.opacity_effect = QGraphicsOpacityEffect()
         self.opacity_effect.setOpacity(0.4)
         container.setGraphicsEffect(self.opacity_effect)
-        
-        # Glow
-        self.glow = QGraphicsDropShadowEffect()
-        self.glow.setBlurRadius(0)
-        self.glow.setColor(QColor(0, 255, 255, 180))
-        self.glow.setOffset(0, 0)
-        self.volume_bg.setGraphicsEffect(self.glow)
-        
+
     def enterEvent(self, event):
         self.opacity_effect.setOpacity(1.0)
-        self.glow.setBlurRadius(20)
+        if self._bg_glow is not None:
+            self.volume_bg.setPixmap(self._bg_glow)
         super().enterEvent(event)
-        
+
     def leaveEvent(self, event):
         self.opacity_effect.setOpacity(0.4)
-        self.glow.setBlurRadius(0)
+        if self._bg_normal is not None:
+            self.volume_bg.setPixmap(self._bg_normal)
         super().leaveEvent(event)
 
 # === Tab Button ===
@@ -245,58 +382,32 @@ class TabButton(QPushButton):
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         self.is_active = False
+        self.setProperty("active", False)
         self.setFlat(True)
         self.setCursor(Qt.PointingHandCursor)
-        self.update_style()
-        
+
     def set_active(self, active):
         self.is_active = active
-        self.update_style()
-        
-    def update_style(self):
-        if self.is_active:
-            self.setStyleSheet("""
-                QPushButton {
-                    color: #00ffff;
-                    font-size: 16px;
-                    font-weight: bold;
-                    border: none;
-                    border-bottom: 3px solid #00ffff;
-                    padding: 8px 20px;
-                    background: transparent;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    color: #6B7B9F;
-                    font-size: 16px;
-                    border: none;
-                    padding: 8px 20px;
-                    background: transparent;
-                }
-                QPushButton:hover {
-                    color: #00ffff;
-                }
-            """)
+        # Flip the dynamic property and repolish; the app stylesheet's
+        # TabButton[active="true"] selector does the rest
+        self.setProperty("active", active)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
 # === Main Music Player ===
 class DJBlueAIMusicPlayer(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("DJ Blue AI")
+        self.setObjectName("mainWindow")
+        # Needed for the app-level background rule to paint a QWidget subclass
+        self.setAttribute(Qt.WA_StyledBackground, True)
         self.setFixedSize(1000, 750)
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #0a0e17, stop:1 #1a2235);
-                color: white;
-            }
-        """)
-        
+
         self.is_playing = False
         self.current_time = 45
         self.total_time = 190
+        self._shown_second = self.current_time
         
         self.init_ui()
         
@@ -374,11 +485,7 @@ class DJBlueAIMusicPlayer(QWidget):
         
         # Title - simple text without gradient
         title = QLabel("DJ Blue AI")
-        title.setStyleSheet("""
-            font-size: 32px;
-            font-weight: bold;
-            color: #00ffff;
-        """)
+        title.setObjectName("titleLabel")
         layout.addWidget(title)
         
         layout.addStretch()
@@ -405,7 +512,7 @@ class DJBlueAIMusicPlayer(QWidget):
         self.total_label = QLabel(self.format_time(self.total_time))
         
         for label in [self.time_label, self.total_label]:
-            label.setStyleSheet("color: #00ffff; font-size: 18px; font-weight: bold;")
+            label.setObjectName("timeLabel")
         
         time_layout.addWidget(self.time_label)
         time_layout.addStretch()
@@ -416,31 +523,12 @@ class DJBlueAIMusicPlayer(QWidget):
         self.progress_slider.setRange(0, self.total_time)
         self.progress_slider.setValue(self.current_time)
         self.progress_slider.valueChanged.connect(self.on_slider_change)
+        self.progress_slider.setObjectName("progressSlider")
         self.progress_slider.setFixedHeight(30)
-        self.progress_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                background: #23345b;
-                height: 8px;
-                border-radius: 4px;
-            }
-            QSlider::sub-page:horizontal {
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-                    stop:0 #00ffff, stop:1 #ff00ff);
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #00ffff;
-                border: 3px solid #0a0e17;
-                width: 18px;
-                height: 18px;
-                border-radius: 9px;
-                margin: -5px 0;
-            }
-        """)
-        
+
         glow = QGraphicsDropShadowEffect()
         glow.setBlurRadius(15)
-        glow.setColor(QColor(0, 255, 255, 120))
+        glow.setColor(_GLOW_TEAL_DIM)
         glow.setOffset(0, 0)
         self.progress_slider.setGraphicsEffect(glow)
         
@@ -463,6 +551,10 @@ class DJBlueAIMusicPlayer(QWidget):
         self.play_btn.clicked.connect(self.toggle_play)
         self.prev_btn.clicked.connect(self.previous_track)
         self.next_btn.clicked.connect(self.next_track)
+
+        # Both icons built once; toggle_play just swaps them
+        self._icon_play = QIcon(load_scaled(ASSETS_DIR / "play.png", 65, 65, Qt.FastTransformation))
+        self._icon_pause = QIcon(load_scaled(ASSETS_DIR / "pause.png", 65, 65, Qt.FastTransformation))
         
         for btn in [self.shuffle_btn, self.prev_btn, self.play_btn, self.next_btn, self.repeat_btn]:
             layout.addWidget(btn)
@@ -486,8 +578,8 @@ class DJBlueAIMusicPlayer(QWidget):
         
         sep1 = QLabel("|")
         sep2 = QLabel("|")
-        sep1.setStyleSheet("color: #444; font-size: 16px;")
-        sep2.setStyleSheet("color: #444; font-size: 16px;")
+        sep1.setObjectName("tabSeparator")
+        sep2.setObjectName("tabSeparator")
         
         layout.addWidget(self.tab_upnext)
         layout.addWidget(sep1)
@@ -509,28 +601,24 @@ class DJBlueAIMusicPlayer(QWidget):
         self.is_playing = not self.is_playing
         
         if self.is_playing:
-            icon_path = ASSETS_DIR / "pause.png"
+            self.play_btn.setIcon(self._icon_pause)
             self.timer.start()
             self.album_art.start_glow()
             print("▶️  Playing...")
         else:
-            icon_path = ASSETS_DIR / "play.png"
+            self.play_btn.setIcon(self._icon_play)
             self.timer.stop()
             self.album_art.stop_glow()
             print("⏸️  Paused")
-            
-        try:
-            pix = QPixmap(str(icon_path))
-            if not pix.isNull():
-                pix = pix.scaled(65, 65, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.play_btn.setIcon(QIcon(pix))
-        except Exception as e:
-            print(f"Error changing play icon: {e}")
         
     def update_progress(self):
         if self.current_time < self.total_time:
             self.current_time += 1
-            self.progress_slider.setValue(self.current_time)
+            # Timer path: skip the valueChanged round-trip and update the
+            # label directly; the signal is for user seeks
+            with QSignalBlocker(self.progress_slider):
+                self.progress_slider.setValue(self.current_time)
+            self._shown_second = self.current_time
             self.time_label.setText(self.format_time(self.current_time))
         else:
             self.timer.stop()
@@ -539,7 +627,10 @@ class DJBlueAIMusicPlayer(QWidget):
             
     def on_slider_change(self, value):
         self.current_time = value
-        self.time_label.setText(self.format_time(value))
+        # Re-render the label only when the displayed second actually changes
+        if value != self._shown_second:
+            self._shown_second = value
+            self.time_label.setText(self.format_time(value))
         
     def previous_track(self):
         print("⏮️  Previous track")
@@ -553,6 +644,8 @@ class DJBlueAIMusicPlayer(QWidget):
         
     @staticmethod
     def format_time(seconds):
+        if 0 <= seconds < len(_TIME_STRINGS):
+            return _TIME_STRINGS[seconds]
         mins = seconds // 60
         secs = seconds % 60
         return f"{mins}:{secs:02d}"
@@ -560,6 +653,9 @@ class DJBlueAIMusicPlayer(QWidget):
 # === MAIN ===
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLESHEET)
+    QPixmapCache.setCacheLimit(20480)  # 20 MB, plenty for all scaled assets
+    preload_assets()
     player = DJBlueAIMusicPlayer()
     player.show()
     sys.exit(app.exec())
\ No newline at end of file
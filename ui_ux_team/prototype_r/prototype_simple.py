@@ -1,11 +1,16 @@
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QPushButton, QLabel, QHBoxLayout, QVBoxLayout, QSlider, QGraphicsDropShadowEffect
+    QApplication, QWidget, QPushButton, QLabel, QHBoxLayout, QVBoxLayout, QGraphicsDropShadowEffect
 )
-from PySide6.QtGui import QPixmap, QIcon, QPainter, QLinearGradient, QColor
-from PySide6.QtCore import Qt, QTimer, QElapsedTimer
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QPainter, QColor
+from PySide6.QtCore import Qt, QTimer, QElapsedTimer, QSignalBlocker
 import sys
 from pathlib import Path
 
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.widgets import SmoothSlider, load_icon_button, themed_icon
+
 # === CONSTANTS ===
 BASE_DIR = Path(__file__).resolve().parent
 ASSETS_DIR = BASE_DIR / "assets"
@@ -18,57 +23,155 @@ ICON_CLOSE = ASSETS_DIR / "close.png"
 ALBUM_ART = ASSETS_DIR / "album.png"
 GRANULARITY = 1000  # ms-level precision
 
+# Every m:ss string up to an hour, built once; format_time is a list index
+_TIME_STRINGS = [f"{s // 60}:{s % 60:02d}" for s in range(3600)]
+
+# One application-level stylesheet, parsed once. Widgets opt in through
+# objectName selectors instead of per-widget setStyleSheet calls, each of
+# which triggers its own parse + repolish.
+APP_STYLESHEET = """
+QWidget#mainWindow {
+    background-color: #1a2235;
+    color: white;
+    border-radius: 10px;
+}
+QLabel#titleLabel {
+    font-size: 18px;
+    font-weight: bold;
+    margin-left: 10px;
+    margin-top: 10px;
+    margin-bottom: 10px;
+}
+QSlider#progressSlider::groove:horizontal {
+    background: #23345b;
+    height: 4px;
+    border-radius: 2px;
+}
+QSlider#progressSlider::sub-page:horizontal {
+    background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+                                stop:0 #ff0080, stop:1 #7a00ff);
+    border-radius: 2px;
+}
+QSlider#progressSlider::handle:horizontal {
+    background: #ff0080;
+    border: 2px solid #1a2235;
+    width: 12px;
+    height: 18px;
+    border-radius: 7px;
+    margin: -6px 0;
+}
+"""
+
+
+# --- Cached pixmap loader ---
+# Full-resolution originals, decoded once by preload_assets() before any
+# widget is built; load_scaled() scales from these instead of re-reading disk
+_PRELOADED = {}
+
+# Paths already reported as unloadable, so a bad asset warns exactly once
+_WARNED_PATHS = set()
+
+
+def preload_assets():
+    """Decode every PNG in ASSETS_DIR up front, in one pass."""
+    for png in sorted(ASSETS_DIR.glob("*.png")):
+        pix = QPixmap(str(png))
+        if not pix.isNull():
+            _PRELOADED[str(png)] = pix
+
+
+def load_scaled(path, w, h, mode=Qt.SmoothTransformation):
+    """Load + scale a pixmap through QPixmapCache so each (path, size) pair
+    is decoded and scaled only once per process.
+
+    Small icons pass Qt.FastTransformation: at <= 60px the quality
+    difference is invisible and the scale is an order of magnitude cheaper.
+    """
+    key = f"{path}|{w}x{h}"
+    pix = QPixmapCache.find(key)
+    if pix is None:
+        pix = _PRELOADED.get(str(path))
+        if pix is None:
+            pix = QPixmap(str(path))
+        if pix.isNull():
+            # QPixmap reports failure through isNull(), it never raises
+            if str(path) not in _WARNED_PATHS:
+                _WARNED_PATHS.add(str(path))
+                print(f"Warning: could not load image: {path}")
+        elif w == h:
+            # square targets (all the art here): skip the aspect-fit math
+            pix = pix.scaledToWidth(w, mode)
+        else:
+            pix = pix.scaled(w, h, Qt.KeepAspectRatio, mode)
+        QPixmapCache.insert(key, pix)
+    return pix
 
-# --- Smooth clickable slider ---
-class SmoothSlider(QSlider):
-    def __init__(self, *args, **kwargs):
-        super().__init__(Qt.Horizontal, *args, **kwargs)
-        self.setCursor(Qt.PointingHandCursor)
-        self.setMouseTracking(True)
 
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            x = event.position().x()
-            vmin, vmax = self.minimum(), self.maximum()
-            w = max(1, self.width() - 1)
-            value = vmin + round((x / w) * (vmax - vmin))
-            self.setValue(value)
-            event.accept()
-        super().mousePressEvent(event)
+# --- Fade helper ---
+# Alpha masks per (size, side): one uint8 ramp computed in numpy and wrapped
+# as Format_Alpha8, instead of evaluating a QLinearGradient per pixel
+_FADE_MASKS = {}
+
+
+def _fade_mask(width, height, side):
+    key = (width, height, side)
+    mask = _FADE_MASKS.get(key)
+    if mask is None:
+        x = np.linspace(0.0, 1.0, width, dtype=np.float32)
+        if side == "right":
+            # opaque at the left edge, fully transparent from 80% on
+            alpha = np.clip((0.8 - x) / 0.8, 0.0, 1.0)
+        else:
+            # transparent up to 20%, then ramp up to opaque
+            alpha = np.clip((x - 0.2) / 0.8, 0.0, 1.0)
+        row = (alpha * 255).astype(np.uint8)
+        ramp = np.ascontiguousarray(np.broadcast_to(row, (height, width)))
+        # .copy() detaches the QImage from the numpy buffer before caching
+        mask = QImage(ramp.tobytes(), width, height, width, QImage.Format_Alpha8).copy()
+        _FADE_MASKS[key] = mask
+    return mask
 
 
-# --- Fade helper ---
 def apply_fade(pixmap: QPixmap, side: str):
     faded = QPixmap(pixmap.size())
     faded.fill(Qt.transparent)
     painter = QPainter(faded)
     painter.drawPixmap(0, 0, pixmap)
-    gradient = QLinearGradient(0, 0, pixmap.width(), 0)
-
-    if side == "right":
-        gradient.setColorAt(0, QColor(26, 34, 53, 255))
-        gradient.setColorAt(0.8, QColor(26, 34, 53, 0))
-    else:
-        gradient.setColorAt(0.2, QColor(26, 34, 53, 0))
-        gradient.setColorAt(1, QColor(26, 34, 53, 255))
-
     painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
-    painter.fillRect(faded.rect(), gradient)
+    painter.drawImage(0, 0, _fade_mask(pixmap.width(), pixmap.height(), side))
     painter.end()
     return faded
 
 
+# Album strip pixmaps, built lazily once per process: apply_fade is a full
+# QPainter pass over the pixmap, no reason to repeat it per window
+_LEFT_ALBUM = None
+_CENTER_ALBUM = None
+_RIGHT_ALBUM = None
+
+
+def _album_pixmaps():
+    global _LEFT_ALBUM, _CENTER_ALBUM, _RIGHT_ALBUM
+    if _LEFT_ALBUM is None:
+        _LEFT_ALBUM = apply_fade(load_scaled(ALBUM_ART, 90, 90), "left")
+        _CENTER_ALBUM = load_scaled(ALBUM_ART, 120, 120)
+        _RIGHT_ALBUM = apply_fade(load_scaled(ALBUM_ART, 90, 90), "right")
+    return _LEFT_ALBUM, _CENTER_ALBUM, _RIGHT_ALBUM
+
+
 # --- Main UI ---
 class MusicPlayerUI(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("DJ Blue AI")
-        self.setStyleSheet("background-color: #1a2235; color: white; border-radius: 10px;")
+        self.setObjectName("mainWindow")
+        # Needed for the app-level background rule to paint a QWidget subclass
+        self.setAttribute(Qt.WA_StyledBackground, True)
         self.setFixedSize(400, 320)
 
         # === Top bar ===
         title = QLabel("Deep Purple - Smoke on the Water")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; margin-left: 10px; margin-top: 10px; margin-bottom: 10px")
+        title.setObjectName("titleLabel")
 
         top_bar = QHBoxLayout()
         top_bar.addWidget(title)
@@ -76,16 +179,8 @@ class MusicPlayerUI(QWidget):
 
         # === Album art row with fades ===
         album_layout = QHBoxLayout()
-        for i in range(3):
+        for pix in _album_pixmaps():
             album = QLabel()
-            pix = QPixmap(str(ALBUM_ART))
-            if i == 0:
-                pix = apply_fade(pix.scaled(90, 90, Qt.KeepAspectRatio, Qt.SmoothTransformation), "left")
-            elif i == 2:
-                pix = apply_fade(pix.scaled(90, 90, Qt.KeepAspectRatio, Qt.SmoothTransformation), "right")
-            else:
-                pix = pix.scaled(120, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
             album.setPixmap(pix)
             album.setAlignment(Qt.AlignCenter)
             album_layout.addWidget(album)
@@ -98,32 +193,11 @@ class MusicPlayerUI(QWidget):
         self.time_right = QLabel(self.format_time(self.total_seconds))
 
         self.slider = SmoothSlider()
+        self.slider.setObjectName("progressSlider")
         self.slider.setRange(0, self.total_seconds * GRANULARITY)
         self.slider.setValue(self.current_time * GRANULARITY)
-        self.slider.valueChanged.connect(
-            lambda v: self.time_left.setText(self.format_time(v // GRANULARITY))
-        )
-
-        self.slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                background: #23345b;
-                height: 4px;
-                border-radius: 2px;
-            }
-            QSlider::sub-page:horizontal {
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-                                            stop:0 #ff0080, stop:1 #7a00ff);
-                border-radius: 2px;
-            }
-            QSlider::handle:horizontal {
-                background: #ff0080;
-                border: 2px solid #1a2235;
-                width: 12px;
-                height: 18px;
-                border-radius: 7px;
-                margin: -6px 0;
-            }
-        """)
+        self._shown_second = self.current_time
+        self.slider.valueChanged.connect(self._on_slider_value)
 
         glow = QGraphicsDropShadowEffect()
         glow.setBlurRadius(15)
@@ -147,9 +221,13 @@ class MusicPlayerUI(QWidget):
         self.is_playing = True
         btn_next.clicked.connect(self.next_song)
 
-        self.setup_icon_button(btn_prev, ICON_PREV, 25)
-        self.setup_icon_button(self.btn_play, ICON_PAUSE, 60)
-        self.setup_icon_button(btn_next, ICON_NEXT, 25)
+        load_icon_button(btn_prev, ICON_PREV, 25)
+        load_icon_button(self.btn_play, ICON_PAUSE, 60)
+        load_icon_button(btn_next, ICON_NEXT, 25)
+
+        # Both icons built once; toggle_play just swaps them
+        self._icon_play = themed_icon(ICON_PLAY)
+        self._icon_pause = themed_icon(ICON_PAUSE)
 
         controls = QHBoxLayout()
         controls.addStretch()
@@ -167,25 +245,29 @@ class MusicPlayerUI(QWidget):
         layout.addLayout(controls)
 
         # === Timer ===
+        # 100ms is plenty: the label only changes once a second and the
+        # slider covers ~400px, so a finer tick just burns repaints
         self._tick = QTimer(self)
-        self._tick.setInterval(16)
+        self._tick.setInterval(100)
         self._elapsed = QElapsedTimer()
         self._elapsed.start()
         self._tick.timeout.connect(self.advance_time)
         self._tick.start()
 
     # --- Helpers ---
-    def setup_icon_button(self, button, path, size):
-        pix = QPixmap(str(path)).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        button.setIcon(QIcon(pix))
-        button.setIconSize(pix.rect().size())
-        button.setFixedSize(size + 10, size + 10)
-        button.setFlat(True)
-        button.setStyleSheet("border: none;")
+    def _on_slider_value(self, v):
+        # Re-render the label only when the displayed second actually changes
+        sec = v // GRANULARITY
+        if sec != self._shown_second:
+            self._shown_second = sec
+            self.time_left.setText(self.format_time(sec))
 
     @staticmethod
     def format_time(sec):
-        m, s = divmod(int(sec), 60)
+        sec = int(sec)
+        if 0 <= sec < len(_TIME_STRINGS):
+            return _TIME_STRINGS[sec]
+        m, s = divmod(sec, 60)
         return f"{m}:{s:02d}"
 
     def advance_time(self):
@@ -194,18 +276,23 @@ class MusicPlayerUI(QWidget):
         dt_s = self._elapsed.restart() / 1000.0
         inc = int(dt_s * GRANULARITY)
         if inc > 0:
-            self.slider.setValue(min(self.slider.value() + inc, self.slider.maximum()))
+            new_value = min(self.slider.value() + inc, self.slider.maximum())
+            # Timer path: skip the valueChanged round-trip and update the
+            # label directly; the signal is for user seeks
+            with QSignalBlocker(self.slider):
+                self.slider.setValue(new_value)
+            self._on_slider_value(new_value)
 
     def toggle_play(self):
         print("Play/Pause pressed!")
         self.is_playing = not self.is_playing
 
         if self.is_playing:
-            self.setup_icon_button(self.btn_play, ICON_PAUSE, 60)
+            self.btn_play.setIcon(self._icon_pause)
             self._elapsed.restart()
             self._tick.start()
         else:
-            self.setup_icon_button(self.btn_play, ICON_PLAY, 60)
+            self.btn_play.setIcon(self._icon_play)
             self._tick.stop()
 
     def next_song(self):
@@ -218,6 +305,9 @@ class MusicPlayerUI(QWidget):
 # --- Entry point ---
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLESHEET)
+    QPixmapCache.setCacheLimit(20480)  # 20 MB, plenty for all scaled assets
+    preload_assets()
     window = MusicPlayerUI()
     window.show()
     sys.exit(app.exec())